@@ -1,7 +1,13 @@
 # damage.py
 import math
 from typing import Tuple, List, Dict, Optional
-from state import PokemonState, FieldState
+from state import (
+    PokemonState,
+    FieldState,
+    SIDE_AURORA_VEIL,
+    SIDE_LIGHT_SCREEN,
+    SIDE_REFLECT,
+)
 from data_loader import MoveData
 
 # Type effectiveness chart for attack_type -> defense_type multipliers
@@ -62,11 +68,11 @@ def calculate_damage(
 
     if (
         defender.ability == "Disguise"
-        and not defender.volatiles.get("disguise_busted", False)
+        and not defender.volatiles.disguise_busted
         and move.category != "Status"
         and move.power > 0
     ):
-        defender.volatiles["disguise_busted"] = True
+        defender.volatiles.disguise_busted = True
         return (0, 0)
 
     name = move.name.lower()
@@ -171,11 +177,12 @@ def calculate_damage(
     doubles_screen_ratio = 2 / 3 if is_doubles else 0.5
     screen_modifier = 1.0
     ignore_screens = attacker.ability == "Infiltrator"
-    idx = max(0, min(len(field.reflect) - 1, defender_side_idx)) if field.reflect else defender_side_idx
+    idx = max(0, min(len(field.side_flags) - 1, defender_side_idx))
     if not ignore_screens:
-        veil_active = bool(field.aurora_veil and field.aurora_veil[idx])
-        reflect_active = bool(field.reflect and field.reflect[idx])
-        light_active = bool(field.light_screen and field.light_screen[idx])
+        flags = field.side_flags[idx]
+        veil_active = (flags & SIDE_AURORA_VEIL) != 0
+        reflect_active = (flags & SIDE_REFLECT) != 0
+        light_active = (flags & SIDE_LIGHT_SCREEN) != 0
         reduction = doubles_screen_ratio
         if veil_active:
             screen_modifier = reduction
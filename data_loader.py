@@ -2,14 +2,27 @@
 from pathlib import Path
 from typing import Dict, List, Optional
 import json
+import sys
 import pandas as pd
 from trainer_data import TrainerDex, Trainer
+# Every distinct move name gets a small contiguous id the first time it is
+# seen, so per-move tables can be flat lists indexed by MoveData.move_id.
+MOVE_IDS: Dict[str, int] = {}
+
+
+def move_id_for(name: str) -> int:
+    move_id = MOVE_IDS.get(name)
+    if move_id is None:
+        move_id = MOVE_IDS[name] = len(MOVE_IDS)
+    return move_id
+
+
 # Define data structures for moves and Pokemon
 class MoveData:
     __slots__ = (
         "name", "type", "category", "power", "accuracy", "pp",
         "effect_chance", "priority", "multihit", "target_def_halved",
-        "has_secondary",
+        "has_secondary", "move_id",
     )
 
     def __init__(
@@ -26,7 +39,7 @@ class MoveData:
         target_def_halved: bool = False,
         has_secondary: bool = False,
     ):
-        self.name = name
+        self.name = sys.intern(name)
         self.type = type
         self.category = category
         self.power = power
@@ -37,6 +50,7 @@ class MoveData:
         self.multihit = multihit
         self.target_def_halved = target_def_halved
         self.has_secondary = has_secondary
+        self.move_id = move_id_for(self.name)
 
 class PokemonData:
     __slots__ = ("name", "types", "base_stats", "abilities")
@@ -5,7 +5,30 @@ import math
 
 from data_loader import MoveData
 from move_effects import apply_effects_for_move
-from state import BattleState, SideState, PokemonState, FieldState
+from state import (
+    BattleState,
+    SideState,
+    PokemonState,
+    FieldState,
+    COUNTER_AURORA_VEIL,
+    COUNTER_GMAX_CANNONADE,
+    COUNTER_GMAX_VINELASH,
+    COUNTER_GMAX_VOLCALITH,
+    COUNTER_GMAX_WILDFIRE,
+    COUNTER_LIGHT_SCREEN,
+    COUNTER_REFLECT,
+    COUNTER_TAILWIND,
+    HAZARD_FLAG_MASK,
+    SCREEN_MASK,
+    SIDE_AURORA_VEIL,
+    SIDE_LIGHT_SCREEN,
+    SIDE_REFLECT,
+    SIDE_STEALTH_ROCK,
+    SIDE_STEELSURGE,
+    SIDE_STICKY_WEB,
+    SIDE_TAILWIND,
+    STAGE_IDX,
+)
 from damage import calculate_damage, type_effectiveness
 from ai_policy import choose_move
 
@@ -145,6 +168,31 @@ ALWAYS_CRIT_MOVES = {
     "Storm Throw",
 }
 
+# Stat stages a critical hit ignores: the attacker's drops, the defender's boosts.
+CRIT_IGNORED_ATTACKER_STAGES = (STAGE_IDX["Atk"], STAGE_IDX["SpA"])
+CRIT_IGNORED_DEFENDER_STAGES = (STAGE_IDX["Def"], STAGE_IDX["SpD"])
+
+HAZARD_FIELDS = (
+    ("spikes", 0),
+    ("toxic_spikes", 0),
+)
+
+SCREEN_COUNTERS = (COUNTER_REFLECT, COUNTER_LIGHT_SCREEN, COUNTER_AURORA_VEIL)
+
+TIMED_SIDE_FLAGS = (
+    (SIDE_REFLECT, COUNTER_REFLECT),
+    (SIDE_LIGHT_SCREEN, COUNTER_LIGHT_SCREEN),
+    (SIDE_AURORA_VEIL, COUNTER_AURORA_VEIL),
+    (SIDE_TAILWIND, COUNTER_TAILWIND),
+)
+
+GMAX_RESIDUALS = (
+    (COUNTER_GMAX_VINELASH, "Grass"),
+    (COUNTER_GMAX_WILDFIRE, "Fire"),
+    (COUNTER_GMAX_CANNONADE, "Water"),
+    (COUNTER_GMAX_VOLCALITH, "Rock"),
+)
+
 CRIT_ITEM_SPECIES = {
     "Stick": {"Farfetch'd", "Farfetch’d", "Sirfetch'd", "Sirfetch’d"},
     "Leek": {"Farfetch'd", "Farfetch’d", "Sirfetch'd", "Sirfetch’d"},
@@ -152,6 +200,25 @@ CRIT_ITEM_SPECIES = {
 }
 
 
+MOODY_STATS = ("Atk", "Def", "SpA", "SpD", "Spe", "Acc", "Eva")
+
+
+def _pick_masked_index(mask: int, rng: Optional[random.Random] = None) -> Optional[int]:
+    """Uniformly pick the position of one set bit in mask (None if empty)."""
+    count = mask.bit_count()
+    if not count:
+        return None
+    k = (random if rng is None else rng).randrange(count)
+    idx = 0
+    while True:
+        if mask & 1:
+            if k == 0:
+                return idx
+            k -= 1
+        mask >>= 1
+        idx += 1
+
+
 def stage_multiplier(stage: int) -> float:
     if stage > 6:
         stage = 6
@@ -247,7 +314,7 @@ def get_crit_stage(attacker: PokemonState, move: MoveData) -> int:
         stage += 1
     if attacker.ability == "Super Luck":
         stage += 1
-    if attacker.volatiles.get("focus_energy", False):
+    if attacker.volatiles.focus_energy:
         stage += 2
     if attacker.item in ("Scope Lens", "Razor Claw"):
         stage += 1
@@ -265,6 +332,7 @@ def roll_crit(
     move: MoveData,
     field: FieldState,
     force_crit: bool = False,
+    rng: Optional[random.Random] = None,
 ) -> bool:
     if move.category not in ("Physical", "Special") or move.power <= 0:
         return False
@@ -285,7 +353,7 @@ def roll_crit(
     if chance >= 1.0:
         return True
 
-    return random.random() < chance
+    return (random if rng is None else rng).random() < chance
 
 
 def compute_damage_for_hit(
@@ -295,6 +363,7 @@ def compute_damage_for_hit(
     field: FieldState,
     attacker_side_idx: int,
     crit: bool,
+    rng: Optional[random.Random] = None,
 ) -> int:
     # Status / non-damaging moves
     if move.category == "Status" or move.power <= 0:
@@ -325,22 +394,20 @@ def compute_damage_for_hit(
     if crit:
         orig_attacker_stages = attacker.stat_stages.copy()
         orig_defender_stages = defender.stat_stages.copy()
-        orig_reflect = field.reflect[:]
-        orig_ls = field.light_screen[:]
-        orig_veil = field.aurora_veil[:]
 
-        for stat in ("Atk", "SpA"):
-            if attacker.stat_stages.get(stat, 0) < 0:
-                attacker.stat_stages[stat] = 0
+        stages = attacker.stat_stages
+        for idx in CRIT_IGNORED_ATTACKER_STAGES:
+            if stages[idx] < 0:
+                stages[idx] = 0
 
-        for stat in ("Def", "SpD"):
-            if defender.stat_stages.get(stat, 0) > 0:
-                defender.stat_stages[stat] = 0
+        stages = defender.stat_stages
+        for idx in CRIT_IGNORED_DEFENDER_STAGES:
+            if stages[idx] > 0:
+                stages[idx] = 0
 
         defender_side_idx = 1 - attacker_side_idx
-        field.reflect[defender_side_idx] = False
-        field.light_screen[defender_side_idx] = False
-        field.aurora_veil[defender_side_idx] = False
+        orig_flags = field.side_flags[defender_side_idx]
+        field.side_flags[defender_side_idx] = orig_flags & ~SCREEN_MASK
 
         dmg_min, dmg_max = calculate_damage(
             attacker,
@@ -352,9 +419,7 @@ def compute_damage_for_hit(
 
         attacker.stat_stages = orig_attacker_stages
         defender.stat_stages = orig_defender_stages
-        field.reflect = orig_reflect
-        field.light_screen = orig_ls
-        field.aurora_veil = orig_veil
+        field.side_flags[defender_side_idx] = orig_flags
 
         crit_mult = 1.5
         if attacker.ability == "Sniper":
@@ -371,7 +436,7 @@ def compute_damage_for_hit(
 
     dmg_min = max(1, dmg_min)
 
-    return random.randint(dmg_min, dmg_max)
+    return (random if rng is None else rng).randint(dmg_min, dmg_max)
 
 
 def get_effective_priority(
@@ -396,6 +461,11 @@ class BattleEnv:
             for mon in side.active:
                 self._on_switch_in(side_idx, mon)   
 
+    @property
+    def rng(self):
+        rng = self.state.rng
+        return random if rng is None else rng
+
     def _find_move_by_name(self, mon: PokemonState, move_name: Optional[str]) -> Optional[MoveData]:
         if not move_name:
             return None
@@ -456,11 +526,10 @@ class BattleEnv:
         skip_action_if_pending: bool = False,
     ) -> bool:
         side = self.state.sides[side_idx]
-        bench = [m for m in side.party if m.current_hp > 0 and m not in side.active]
+        bench = side.bench_indices()
         if not bench:
             return False
-        replacement = random.choice(bench) if random_choice else bench[0]
-        side.active[0] = replacement
+        replacement = side.switch_to(self.rng.choice(bench) if random_choice else bench[0])
         self._on_switch_in(side_idx, replacement)
         if skip_action_if_pending and not self._turn_has_acted[side_idx]:
             self._turn_skip_action[side_idx] = True
@@ -506,19 +575,24 @@ class BattleEnv:
             self._boost_stat_stage(defender, "SpA", 2)
 
     def _attempt_protect(self, mon: PokemonState) -> bool:
-        streak = mon.volatiles.get("protect_streak", 0)
+        streak = mon.volatiles.protect_streak or 0
         success_chance = 1.0 / (2 ** streak) if streak > 0 else 1.0
-        if random.random() > success_chance:
-            mon.volatiles["protect_streak"] = streak
+        if self.rng.random() > success_chance:
+            mon.volatiles.protect_streak = streak
             return False
-        mon.volatiles["protect_active"] = True
-        mon.volatiles["protect_streak"] = streak + 1
+        mon.volatiles.protect_active = True
+        mon.volatiles.protect_streak = streak + 1
         return True
 
+    def _finish_action(self, attacker: PokemonState, move_name: str) -> None:
+        attacker.last_move_used = move_name
+        attacker.volatiles.focus_punch_pending = None
+        self._reset_protect_counter(attacker, move_name)
+
     def _reset_protect_counter(self, mon: PokemonState, move_name: str) -> None:
         if move_name in PROTECT_MOVES:
             return
-        mon.volatiles.pop("protect_streak", None)
+        mon.volatiles.protect_streak = None
 
     def _use_substitute(self, mon: PokemonState) -> bool:
         if mon.substitute_hp is not None:
@@ -531,18 +605,18 @@ class BattleEnv:
         return True
 
     def _apply_confusion(self, target: PokemonState, min_turns: int = 2, max_turns: int = 5) -> None:
-        target.volatiles["confusion_turns"] = random.randint(min_turns, max_turns)
+        target.volatiles.confusion_turns = self.rng.randint(min_turns, max_turns)
 
     def _apply_taunt(self, target: PokemonState, duration: int = 3) -> None:
-        target.volatiles["taunt_turns"] = duration
+        target.volatiles.taunt_turns = duration
 
     def _apply_torment(self, target: PokemonState) -> None:
-        target.volatiles["torment"] = True
+        target.volatiles.torment = True
 
     def _apply_encore(self, target: PokemonState, duration: int = 3) -> None:
         if not target.last_move_used:
             return
-        target.volatiles["encore"] = {
+        target.volatiles.encore = {
             "move": target.last_move_used,
             "turns": duration,
         }
@@ -550,18 +624,18 @@ class BattleEnv:
     def _apply_disable(self, target: PokemonState, duration: int = 4) -> None:
         if not target.last_move_used:
             return
-        target.volatiles["disable"] = {
+        target.volatiles.disable = {
             "move": target.last_move_used,
             "turns": duration,
         }
 
     def _apply_infatuation(self, target: PokemonState, source_idx: int) -> None:
-        target.volatiles["infatuated_with"] = source_idx
+        target.volatiles.infatuated_with = source_idx
 
     def _apply_leech_seed(self, target: PokemonState, source_idx: int) -> None:
         if "Grass" in target.types:
             return
-        target.volatiles["leech_seed"] = source_idx
+        target.volatiles.leech_seed = source_idx
 
     def _handle_custom_status_move(
         self,
@@ -579,11 +653,11 @@ class BattleEnv:
             return True
 
         if name == "Focus Energy":
-            attacker.volatiles["focus_energy"] = True
+            attacker.volatiles.focus_energy = True
             return True
 
         if name == "Laser Focus":
-            attacker.volatiles["laser_focus"] = True
+            attacker.volatiles.laser_focus = True
             return True
 
         if name in SUBSTITUTE_MOVES:
@@ -594,32 +668,32 @@ class BattleEnv:
             return False
 
         if name in TAUNT_MOVES:
-            if defender.substitute_hp is None and not defender.volatiles.get("protect_active"):
+            if defender.substitute_hp is None and not defender.volatiles.protect_active:
                 self._apply_taunt(defender)
             return True
 
         if name in ENCORE_MOVES:
-            if defender.substitute_hp is None and not defender.volatiles.get("protect_active"):
+            if defender.substitute_hp is None and not defender.volatiles.protect_active:
                 self._apply_encore(defender)
             return True
 
         if name in DISABLE_MOVES:
-            if defender.substitute_hp is None and not defender.volatiles.get("protect_active"):
+            if defender.substitute_hp is None and not defender.volatiles.protect_active:
                 self._apply_disable(defender)
             return True
 
         if name in TORMENT_MOVES:
-            if defender.substitute_hp is None and not defender.volatiles.get("protect_active"):
+            if defender.substitute_hp is None and not defender.volatiles.protect_active:
                 self._apply_torment(defender)
             return True
 
         if name in INFATUATION_MOVES:
-            if defender.substitute_hp is None and not defender.volatiles.get("protect_active"):
+            if defender.substitute_hp is None and not defender.volatiles.protect_active:
                 self._apply_infatuation(defender, actor_idx)
             return True
 
         if name in CONFUSION_STATUS_MOVES:
-            if defender.substitute_hp is None and not defender.volatiles.get("protect_active"):
+            if defender.substitute_hp is None and not defender.volatiles.protect_active:
                 self._apply_confusion(defender)
             if name == "Swagger":
                 defender.change_stat_stage("Atk", 2, source=attacker, from_opponent=True)
@@ -628,7 +702,7 @@ class BattleEnv:
             return True
 
         if name in LEECH_SEED_MOVES:
-            if defender.substitute_hp is None and not defender.volatiles.get("protect_active"):
+            if defender.substitute_hp is None and not defender.volatiles.protect_active:
                 self._apply_leech_seed(defender, actor_idx)
             return True
 
@@ -646,71 +720,71 @@ class BattleEnv:
     ) -> Tuple[MoveData, bool]:
         resolved = requested_move
 
-        locked = attacker.volatiles.get("locked_move")
+        locked = attacker.volatiles.locked_move
         if locked:
             forced = self._find_move_by_name(attacker, locked.get("move"))
             if forced:
                 resolved = forced
 
-        encore = attacker.volatiles.get("encore")
+        encore = attacker.volatiles.encore
         if encore:
             forced = self._find_move_by_name(attacker, encore.get("move"))
             if forced:
                 resolved = forced
             else:
-                attacker.volatiles.pop("encore", None)
+                attacker.volatiles.encore = None
 
-        charge = attacker.volatiles.get("charging_move")
+        charge = attacker.volatiles.charging_move
         if charge:
             stored = charge.get("move")
             if stored:
                 resolved = stored
-            attacker.volatiles.pop("charging_move", None)
+            attacker.volatiles.charging_move = None
             return resolved, False
 
         if resolved and resolved.name in CHARGE_MOVES and not self._can_skip_charge(resolved):
-            attacker.volatiles["charging_move"] = {"move": resolved}
+            attacker.volatiles.charging_move = {"move": resolved}
             return resolved, True
 
         return resolved, False
 
     def _is_move_blocked(self, attacker: PokemonState, move: MoveData) -> bool:
-        disable = attacker.volatiles.get("disable")
+        disable = attacker.volatiles.disable
         if disable and disable.get("move") == move.name:
             return True
 
-        taunt_turns = attacker.volatiles.get("taunt_turns", 0)
+        taunt_turns = attacker.volatiles.taunt_turns
         if taunt_turns and move.category == "Status":
             return True
 
-        if attacker.volatiles.get("torment") and attacker.last_move_used == move.name:
+        if attacker.volatiles.torment and attacker.last_move_used == move.name:
             return True
 
         return False
 
     def _apply_partial_trap(self, target: PokemonState, source_idx: int) -> None:
-        duration = 4 + random.randint(0, 1)
-        target.volatiles["partial_trap"] = {
+        duration = 4 + self.rng.randint(0, 1)
+        target.volatiles.partial_trap = {
             "turns": duration,
             "source": source_idx,
         }
 
     def _start_lock_in(self, attacker: PokemonState, move: MoveData) -> None:
-        locked = attacker.volatiles.get("locked_move")
+        locked = attacker.volatiles.locked_move
         if locked and locked.get("move") == move.name:
             turns = locked.get("turns", 0) - 1
             if turns <= 0:
-                attacker.volatiles.pop("locked_move", None)
+                attacker.volatiles.locked_move = None
                 if locked.get("confuse", False):
                     self._apply_confusion(attacker)
             else:
                 locked["turns"] = turns
             return
 
-        duration = random.randint(2, 3)
+        duration = self.rng.randint(2, 3)
         if duration <= 1:
             return
-        attacker.volatiles["locked_move"] = {
+        attacker.volatiles.locked_move = {
             "move": move.name,
             "turns": duration - 1,
             "confuse": True,
@@ -739,8 +813,7 @@ class BattleEnv:
             self.winner = 1
             return
 
-        alive = [m for m in side.party if m.current_hp > 0 and m not in side.active]
-        if alive:
+        if side.bench_indices():
             swapped = self._force_switch(side_idx, skip_action_if_pending=True)
             if not swapped:
                 self.done = True
@@ -750,14 +823,21 @@ class BattleEnv:
             self.winner = 0
 
     def _deal_damage(self, target: PokemonState, amount: int) -> int:
-        if amount <= 0 or target.current_hp <= 0:
+        hp = target.current_hp
+        if amount <= 0 or hp <= 0:
             return 0
-        if target.volatiles.get("focus_punch_pending"):
-            target.volatiles["focus_punch_failed"] = True
-        target.current_hp = max(0, target.current_hp - amount)
-        self._check_hp_items(target)
-        if target.current_hp == 0:
-            self._handle_faint(self._active_index(target))
+        volatiles = target.volatiles
+        if volatiles.focus_punch_pending:
+            volatiles.focus_punch_failed = True
+        hp -= amount
+        if hp > 0:
+            target.current_hp = hp
+            if target.item:
+                self._check_hp_items(target)
+            return amount
+        # Only the fainting path needs the env-level bookkeeping.
+        target.current_hp = 0
+        self._handle_faint(self._active_index(target))
         return amount
 
     def _apply_confusion_self_hit(self, attacker: PokemonState) -> None:
@@ -766,44 +846,44 @@ class BattleEnv:
             return
         low = max(1, min(dmg_min, dmg_max))
         high = max(1, max(dmg_min, dmg_max))
-        damage = random.randint(low, high)
+        damage = self.rng.randint(low, high)
         self._deal_damage(attacker, damage)
 
     def _process_confusion(self, attacker: PokemonState) -> bool:
-        turns = attacker.volatiles.get("confusion_turns")
+        turns = attacker.volatiles.confusion_turns
         if not turns:
             return True
         turns -= 1
         if turns <= 0:
-            attacker.volatiles.pop("confusion_turns", None)
+            attacker.volatiles.confusion_turns = None
         else:
-            attacker.volatiles["confusion_turns"] = turns
-        if random.random() < (1 / 3):
+            attacker.volatiles.confusion_turns = turns
+        if self.rng.random() < (1 / 3):
             self._apply_confusion_self_hit(attacker)
             return False
         return True
 
     def _process_infatuation(self, attacker: PokemonState, target: PokemonState) -> bool:
-        source_idx = attacker.volatiles.get("infatuated_with")
+        source_idx = attacker.volatiles.infatuated_with
         if source_idx is None:
             return True
         target_idx = self._active_index(target)
         if target_idx != source_idx:
-            attacker.volatiles.pop("infatuated_with", None)
+            attacker.volatiles.infatuated_with = None
             return True
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             return False
         return True
 
     def _process_primary_status(self, attacker: PokemonState, move: MoveData) -> bool:
         if attacker.status == "slp":
-            turns = attacker.volatiles.get("sleep_turns")
+            turns = attacker.volatiles.sleep_turns
             if turns is None:
-                turns = random.randint(1, 3)
-                attacker.volatiles["sleep_turns"] = turns
+                turns = self.rng.randint(1, 3)
+                attacker.volatiles.sleep_turns = turns
             if turns > 0:
                 turns -= 1
-                attacker.volatiles["sleep_turns"] = turns
+                attacker.volatiles.sleep_turns = turns
                 if turns == 0:
                     attacker.cure_status()
                 return False
@@ -818,12 +898,12 @@ class BattleEnv:
                 "Fusion Flare",
             }
             forced_thaw = move.type == "Fire" or move.name in thawing_moves
-            if forced_thaw or random.random() < 0.2:
+            if forced_thaw or self.rng.random() < 0.2:
                 attacker.cure_status()
             else:
                 return False
 
-        if attacker.status == "par" and random.random() < 0.25:
+        if attacker.status == "par" and self.rng.random() < 0.25:
             return False
 
         if attacker.volatiles.pop("flinch", False):
@@ -892,7 +972,7 @@ class BattleEnv:
     def _handle_eject_pack_trigger(self, side_idx: int, force_skip: Optional[bool] = None) -> None:
         mon = self.state.sides[side_idx].active[0]
         if mon.current_hp <= 0:
-            mon.volatiles.pop("eject_pack_trigger", None)
+            mon.volatiles.eject_pack_trigger = None
             return
         if not mon.volatiles.pop("eject_pack_trigger", False):
             return
@@ -996,58 +1076,44 @@ class BattleEnv:
             return
 
         gmax_residual_map = {
-            "G-Max Vine Lash": ("gmax_vinelash_turns", 4),
-            "G-Max Wildfire": ("gmax_wildfire_turns", 4),
-            "G-Max Cannonade": ("gmax_cannonade_turns", 4),
-            "G-Max Volcalith": ("gmax_volcalith_turns", 4),
+            "G-Max Vine Lash": (COUNTER_GMAX_VINELASH, 4),
+            "G-Max Wildfire": (COUNTER_GMAX_WILDFIRE, 4),
+            "G-Max Cannonade": (COUNTER_GMAX_CANNONADE, 4),
+            "G-Max Volcalith": (COUNTER_GMAX_VOLCALITH, 4),
         }
 
         if name in gmax_residual_map and total_damage > 0:
-            attr, turns = gmax_residual_map[name]
-            getattr(self.state.field, attr)[target_idx] = turns
+            counter, turns = gmax_residual_map[name]
+            self.state.field.side_counters[target_idx][counter] = turns
 
     def _remove_user_bindings(self, mon: PokemonState) -> None:
-        mon.volatiles.pop("partial_trap", None)
-        mon.volatiles.pop("leech_seed", None)
+        mon.volatiles.partial_trap = None
+        mon.volatiles.leech_seed = None
         mon.is_salt_cure = False
 
-    def _clear_hazards_from_side(self, side_idx: int) -> None:
+    def _reset_side_fields(self, side_idx: int, fields: Tuple[Tuple[str, Any], ...]) -> None:
         field = self.state.field
-        field.spikes[side_idx] = 0
-        field.toxic_spikes[side_idx] = 0
-        field.stealth_rocks[side_idx] = False
-        field.sticky_web[side_idx] = False
-        field.steelsurge[side_idx] = False
+        for attr, reset_value in fields:
+            getattr(field, attr)[side_idx] = reset_value
+
+    def _clear_hazards_from_side(self, side_idx: int) -> None:
+        self._reset_side_fields(side_idx, HAZARD_FIELDS)
+        self.state.field.clear_side_flag(side_idx, HAZARD_FLAG_MASK)
 
     def _clear_screens_from_side(self, side_idx: int) -> None:
         field = self.state.field
-        field.reflect[side_idx] = False
-        field.reflect_turns[side_idx] = 0
-        field.light_screen[side_idx] = False
-        field.light_screen_turns[side_idx] = 0
-        field.aurora_veil[side_idx] = False
-        field.aurora_veil_turns[side_idx] = 0
+        counters = field.side_counters[side_idx]
+        for counter in SCREEN_COUNTERS:
+            counters[counter] = 0
+        field.clear_side_flag(side_idx, SCREEN_MASK)
 
     def _swap_side_conditions(self) -> None:
         field = self.state.field
         for attr in (
             "spikes",
             "toxic_spikes",
-            "stealth_rocks",
-            "sticky_web",
-            "steelsurge",
-            "reflect",
-            "light_screen",
-            "aurora_veil",
-            "tailwind",
-            "gmax_vinelash_turns",
-            "gmax_wildfire_turns",
-            "gmax_cannonade_turns",
-            "gmax_volcalith_turns",
-            "tailwind_turns",
-            "reflect_turns",
-            "light_screen_turns",
-            "aurora_veil_turns",
+            "side_flags",
+            "side_counters",
         ):
             arr = getattr(field, attr)
             arr[0], arr[1] = arr[1], arr[0]
@@ -1057,12 +1123,14 @@ class BattleEnv:
         hazard_blocked = mon.item == "Heavy-Duty Boots"
         grounded = mon.is_grounded(field)
         magic_guard = mon.ability == "Magic Guard"
+        deal = self._deal_damage
+        flags = field.side_flags[side_idx]
 
-        if field.stealth_rocks[side_idx] and not hazard_blocked:
+        if flags & SIDE_STEALTH_ROCK and not hazard_blocked:
             eff = type_effectiveness("Rock", mon.types, field)
             if eff > 0 and not magic_guard:
                 dmg = max(1, math.floor(mon.max_hp * eff / 8))
-                self._deal_damage(mon, dmg)
+                deal(mon, dmg)
                 if self.done:
                     return
 
@@ -1071,15 +1139,15 @@ class BattleEnv:
             denom_map = {1: 8, 2: 6, 3: 4}
             denom = denom_map.get(spikes_layers, 8)
             dmg = max(1, mon.max_hp // denom)
-            self._deal_damage(mon, dmg)
+            deal(mon, dmg)
             if self.done:
                 return
 
-        if field.steelsurge[side_idx] and not hazard_blocked and not magic_guard:
+        if flags & SIDE_STEELSURGE and not hazard_blocked and not magic_guard:
             eff = type_effectiveness("Steel", mon.types, field)
             if eff > 0:
                 dmg = max(1, math.floor(mon.max_hp * eff / 6))
-                self._deal_damage(mon, dmg)
+                deal(mon, dmg)
                 if self.done:
                     return
 
@@ -1093,9 +1161,9 @@ class BattleEnv:
                 pass
             else:
                 status = "psn" if tox_layers == 1 else "tox"
-                mon.apply_status(status)
+                mon.apply_status(status, self.state.rng)
 
-        if field.sticky_web[side_idx] and grounded and not hazard_blocked:
+        if flags & SIDE_STICKY_WEB and grounded and not hazard_blocked:
             mon.change_stat_stage("Spe", -1, source=None, from_opponent=True)
 
     def _apply_side_residuals(self, side_idx: int) -> None:
@@ -1103,15 +1171,9 @@ class BattleEnv:
         mon = self.state.sides[side_idx].active[0]
         magic_guard = mon.ability == "Magic Guard" if mon.current_hp > 0 else False
 
-        residuals = [
-            ("gmax_vinelash_turns", "Grass"),
-            ("gmax_wildfire_turns", "Fire"),
-            ("gmax_cannonade_turns", "Water"),
-            ("gmax_volcalith_turns", "Rock"),
-        ]
-
-        for attr, immune_type in residuals:
-            turns = getattr(field, attr)[side_idx]
+        counters = field.side_counters[side_idx]
+        for counter, immune_type in GMAX_RESIDUALS:
+            turns = counters[counter]
             if turns <= 0:
                 continue
 
@@ -1122,7 +1184,217 @@ class BattleEnv:
                     if self.done:
                         return
 
-            getattr(field, attr)[side_idx] = max(0, turns - 1)
+            counters[counter] = max(0, turns - 1)
+
+    def _precheck_action(
+        self,
+        actor_idx: int,
+        attacker: PokemonState,
+        target: PokemonState,
+        move: MoveData,
+        skip_action: bool,
+    ) -> bool:
+        """Run the universal pre-move guards; False means the action ends here."""
+        volatiles = attacker.volatiles
+        if move.name != FOCUS_PUNCH_NAME:
+            volatiles.focus_punch_pending = None
+            volatiles.focus_punch_failed = None
+
+        self._turn_has_acted[actor_idx] = True
+
+        if skip_action or self._is_move_blocked(attacker, move):
+            return False
+
+        if move.name == FOCUS_PUNCH_NAME and volatiles.pop("focus_punch_failed", False):
+            return False
+
+        if (
+            move.priority > 0
+            and target is not attacker
+            and self.state.field.has_terrain("Psychic")
+            and target.is_grounded(self.state.field)
+        ):
+            return False
+
+        return self._can_act_this_turn(attacker, target, move)
+
+    def _handle_status_move(
+        self,
+        attacker: PokemonState,
+        target: PokemonState,
+        move: MoveData,
+        actor_idx: int,
+        target_idx: int,
+        move_lands: bool,
+    ) -> None:
+        if (
+            move_lands
+            and target is not attacker
+            and self._apply_move_absorption(target, move)
+        ):
+            self._finish_action(attacker, move.name)
+            return
+
+        status_user = attacker
+        status_target = target
+        status_actor_idx = actor_idx
+        status_target_idx = target_idx
+
+        if (
+            move_lands
+            and target is not attacker
+            and target.ability == "Magic Bounce"
+        ):
+            status_user = target
+            status_target = attacker
+            status_actor_idx, status_target_idx = target_idx, actor_idx
+
+        handled = self._handle_custom_status_move(
+            status_user,
+            status_target,
+            move,
+            status_actor_idx,
+            status_target_idx,
+            move_lands,
+        )
+
+        if not handled and move_lands:
+            if status_target is status_user or not status_target.volatiles.protect_active:
+                if status_target is status_user or status_target.substitute_hp is None:
+                    apply_effects_for_move(
+                        self.state,
+                        status_user,
+                        status_target,
+                        move.move_id,
+                        actor_side_idx=status_actor_idx,
+                        success=True,
+                    )
+            self._handle_special_move_followups(
+                status_user,
+                status_target,
+                move,
+                status_actor_idx,
+                status_target_idx,
+                move_lands,
+                0,
+            )
+        self._handle_eject_pack_trigger(status_actor_idx)
+        self._handle_eject_pack_trigger(status_target_idx)
+        self._handle_pivoting_move(status_actor_idx, move, move_lands)
+        self._handle_phazing_move(status_target_idx, move, move_lands)
+        self._finish_action(attacker, move.name)
+
+    def _handle_damaging_move(
+        self,
+        attacker: PokemonState,
+        target: PokemonState,
+        move: MoveData,
+        actor_idx: int,
+        target_idx: int,
+        move_lands: bool,
+    ) -> None:
+        if target is not attacker and target.volatiles.protect_active:
+            self._finish_action(attacker, move.name)
+            return
+
+        if (
+            move_lands
+            and target is not attacker
+            and self._apply_move_absorption(target, move)
+        ):
+            self._finish_action(attacker, move.name)
+            return
+
+        force_crit = attacker.volatiles.pop("laser_focus", False)
+        effectiveness = type_effectiveness(move.type, target.types, self.state.field)
+
+        hits = 1
+        if move.multihit != (1, 1):
+            min_hits, max_hits = move.multihit
+            hits = self.rng.randint(min_hits, max_hits)
+            if attacker.ability == "Skill Link":
+                hits = max_hits
+
+        total_effective_damage = 0
+        hp_damage = 0
+        if not move_lands:
+            hits = 0
+
+        deal = self._deal_damage
+        rng = self.state.rng
+        for _ in range(hits):
+            crit = roll_crit(attacker, target, move, self.state.field, force_crit=force_crit, rng=rng)
+            damage = compute_damage_for_hit(
+                attacker,
+                target,
+                move,
+                self.state.field,
+                attacker_side_idx=actor_idx,
+                crit=crit,
+                rng=rng,
+            )
+            if damage <= 0:
+                continue
+            if target.substitute_hp is not None:
+                applied = min(damage, target.substitute_hp)
+                target.substitute_hp -= applied
+                if target.substitute_hp <= 0:
+                    target.substitute_hp = None
+                total_effective_damage += applied
+                continue
+
+            applied = deal(target, damage)
+            total_effective_damage += applied
+            hp_damage += applied
+            if target.current_hp <= 0 or self.done:
+                break
+
+        if hp_damage > 0:
+            apply_effects_for_move(
+                self.state,
+                attacker,
+                target,
+                move.move_id,
+                actor_side_idx=actor_idx,
+                success=True,
+            )
+            self._handle_post_damage_effects(attacker, target, move, total_effective_damage)
+            self._handle_defender_damage_items(
+                target,
+                attacker,
+                target_idx,
+                actor_idx,
+                effectiveness,
+                hp_damage,
+            )
+            if move.name in PARTIAL_TRAP_MOVES and target.current_hp > 0:
+                self._apply_partial_trap(target, actor_idx)
+
+        self._handle_special_move_followups(
+            attacker,
+            target,
+            move,
+            actor_idx,
+            target_idx,
+            move_lands,
+            total_effective_damage,
+        )
+
+        self._handle_eject_pack_trigger(actor_idx)
+        self._handle_eject_pack_trigger(target_idx)
+        self._handle_pivoting_move(actor_idx, move, move_lands)
+        # Nothing to drag out if the target already left (Eject Button etc.).
+        self._handle_phazing_move(
+            target_idx,
+            move,
+            move_lands and self.state.sides[target_idx].active[0] is target,
+        )
+
+        if move.name in RAMPAGE_MOVES:
+            if hp_damage > 0 or attacker.volatiles.locked_move:
+                self._start_lock_in(attacker, move)
+
+        self._finish_action(attacker, move.name)
 
     def apply_turn(self, player_move: MoveData, player_target_idx: int = 1):
         ai_side = self.state.sides[1]
@@ -1134,7 +1406,7 @@ class BattleEnv:
             ai_active,
             player_active,
             self.state,
-            [m for m in ai_active.moves],
+            ai_active.moves,
         )
 
         p_priority = get_effective_priority(player_active, player_move, self.state.field)
@@ -1146,7 +1418,7 @@ class BattleEnv:
             p_speed = player_active.get_effective_speed(self.state.field, 0)
             ai_speed = ai_active.get_effective_speed(self.state.field, 1)
             if p_speed == ai_speed:
-                first_actor = 0 if random.random() < 0.5 else 1
+                first_actor = 0 if self.rng.random() < 0.5 else 1
             else:
                 first_actor = 0 if p_speed > ai_speed else 1
 
@@ -1156,8 +1428,8 @@ class BattleEnv:
         ]
         for _, attacker, move in prep_actions:
             if move.name == FOCUS_PUNCH_NAME:
-                attacker.volatiles["focus_punch_pending"] = True
-                attacker.volatiles.pop("focus_punch_failed", None)
+                attacker.volatiles.focus_punch_pending = True
+                attacker.volatiles.focus_punch_failed = None
 
         actions = [
             (0, player_move),
@@ -1184,48 +1456,9 @@ class BattleEnv:
                 continue
 
             move, skip_action = self._resolve_move_choice(attacker, move)
-            moved_second = actor_idx != first_actor
-
-            if move.name != FOCUS_PUNCH_NAME:
-                attacker.volatiles.pop("focus_punch_pending", None)
-                attacker.volatiles.pop("focus_punch_failed", None)
-
-            self._turn_has_acted[actor_idx] = True
-
-            if skip_action:
-                attacker.last_move_used = move.name
-                self._reset_protect_counter(attacker, move.name)
-                attacker.volatiles.pop("focus_punch_pending", None)
-                continue
-
-            if self._is_move_blocked(attacker, move):
-                attacker.volatiles.pop("focus_punch_pending", None)
-                attacker.last_move_used = move.name
-                self._reset_protect_counter(attacker, move.name)
-                continue
-
-            if move.name == FOCUS_PUNCH_NAME:
-                if attacker.volatiles.pop("focus_punch_failed", False):
-                    attacker.volatiles.pop("focus_punch_pending", None)
-                    attacker.last_move_used = move.name
-                    self._reset_protect_counter(attacker, move.name)
-                    continue
-
-            if (
-                move.priority > 0
-                and target is not attacker
-                and self.state.field.has_terrain("Psychic")
-                and target.is_grounded(self.state.field)
-            ):
-                attacker.volatiles.pop("focus_punch_pending", None)
-                attacker.last_move_used = move.name
-                self._reset_protect_counter(attacker, move.name)
-                continue
 
-            if not self._can_act_this_turn(attacker, target, move):
-                attacker.volatiles.pop("focus_punch_pending", None)
-                attacker.last_move_used = move.name
-                self._reset_protect_counter(attacker, move.name)
+            if not self._precheck_action(actor_idx, attacker, target, move, skip_action):
+                self._finish_action(attacker, move.name)
                 continue
 
             move_lands = True
@@ -1235,177 +1468,14 @@ class BattleEnv:
                 target,
                 move,
                 self.state.field,
-                moved_second=moved_second,
+                moved_second=actor_idx != first_actor,
             )
             if effective_acc is not None:
-                if random.randint(1, 100) > int(effective_acc):
+                if self.rng.randint(1, 100) > int(effective_acc):
                     move_lands = False
 
-            force_crit = False
-
-            if move.category == "Status":
-                if (
-                    move_lands
-                    and target is not attacker
-                    and self._apply_move_absorption(target, move)
-                ):
-                    attacker.last_move_used = move.name
-                    attacker.volatiles.pop("focus_punch_pending", None)
-                    self._reset_protect_counter(attacker, move.name)
-                    continue
-
-                status_user = attacker
-                status_target = target
-                status_actor_idx = actor_idx
-                status_target_idx = target_idx
-
-                if (
-                    move_lands
-                    and target is not attacker
-                    and target.ability == "Magic Bounce"
-                ):
-                    status_user = target
-                    status_target = attacker
-                    status_actor_idx, status_target_idx = target_idx, actor_idx
-
-                handled = self._handle_custom_status_move(
-                    status_user,
-                    status_target,
-                    move,
-                    status_actor_idx,
-                    status_target_idx,
-                    move_lands,
-                )
-
-                if not handled and move_lands:
-                    if status_target is status_user or not status_target.volatiles.get("protect_active"):
-                        if status_target is status_user or status_target.substitute_hp is None:
-                            apply_effects_for_move(
-                                self.state,
-                                status_user,
-                                status_target,
-                                move.name,
-                                actor_side_idx=status_actor_idx,
-                                success=True,
-                            )
-                    self._handle_special_move_followups(
-                        status_user,
-                        status_target,
-                        move,
-                        status_actor_idx,
-                        status_target_idx,
-                        move_lands,
-                        0,
-                    )
-                self._handle_eject_pack_trigger(status_actor_idx)
-                self._handle_eject_pack_trigger(status_target_idx)
-                self._handle_pivoting_move(status_actor_idx, move, move_lands)
-                self._handle_phazing_move(status_target_idx, move, move_lands)
-                attacker.last_move_used = move.name
-                attacker.volatiles.pop("focus_punch_pending", None)
-                self._reset_protect_counter(attacker, move.name)
-                continue
-
-            if target is not attacker and target.volatiles.get("protect_active"):
-                attacker.last_move_used = move.name
-                attacker.volatiles.pop("focus_punch_pending", None)
-                self._reset_protect_counter(attacker, move.name)
-                continue
-
-            if (
-                move_lands
-                and target is not attacker
-                and self._apply_move_absorption(target, move)
-            ):
-                attacker.last_move_used = move.name
-                attacker.volatiles.pop("focus_punch_pending", None)
-                self._reset_protect_counter(attacker, move.name)
-                continue
-
-            force_crit = attacker.volatiles.pop("laser_focus", False)
-            effectiveness = type_effectiveness(move.type, target.types, self.state.field)
-
-            hits = 1
-            if move.multihit != (1, 1):
-                min_hits, max_hits = move.multihit
-                hits = random.randint(min_hits, max_hits)
-                if attacker.ability == "Skill Link":
-                    hits = max_hits
-
-            total_effective_damage = 0
-            hp_damage = 0
-            if not move_lands:
-                hits = 0
-
-            for _ in range(hits):
-                crit = roll_crit(attacker, target, move, self.state.field, force_crit=force_crit)
-                damage = compute_damage_for_hit(
-                    attacker,
-                    target,
-                    move,
-                    self.state.field,
-                    attacker_side_idx=actor_idx,
-                    crit=crit,
-                )
-                if damage <= 0:
-                    continue
-                if target.substitute_hp is not None:
-                    applied = min(damage, target.substitute_hp)
-                    target.substitute_hp -= applied
-                    if target.substitute_hp <= 0:
-                        target.substitute_hp = None
-                    total_effective_damage += applied
-                    continue
-
-                applied = self._deal_damage(target, damage)
-                total_effective_damage += applied
-                hp_damage += applied
-                if target.current_hp <= 0 or self.done:
-                    break
-
-            if hp_damage > 0:
-                apply_effects_for_move(
-                    self.state,
-                    attacker,
-                    target,
-                    move.name,
-                    actor_side_idx=actor_idx,
-                    success=True,
-                )
-                self._handle_post_damage_effects(attacker, target, move, total_effective_damage)
-                self._handle_defender_damage_items(
-                    target,
-                    attacker,
-                    target_idx,
-                    actor_idx,
-                    effectiveness,
-                    hp_damage,
-                )
-                if move.name in PARTIAL_TRAP_MOVES and target.current_hp > 0:
-                    self._apply_partial_trap(target, actor_idx)
-
-            self._handle_special_move_followups(
-                attacker,
-                target,
-                move,
-                actor_idx,
-                target_idx,
-                move_lands,
-                total_effective_damage,
-            )
-
-            self._handle_eject_pack_trigger(actor_idx)
-            self._handle_eject_pack_trigger(target_idx)
-            self._handle_pivoting_move(actor_idx, move, move_lands)
-            self._handle_phazing_move(target_idx, move, move_lands)
-
-            if move.name in RAMPAGE_MOVES:
-                if hp_damage > 0 or attacker.volatiles.get("locked_move"):
-                    self._start_lock_in(attacker, move)
-
-            attacker.last_move_used = move.name
-            attacker.volatiles.pop("focus_punch_pending", None)
-            self._reset_protect_counter(attacker, move.name)
+            handler = MOVE_HANDLERS.get(move.category, BattleEnv._handle_damaging_move)
+            handler(self, attacker, target, move, actor_idx, target_idx, move_lands)
 
         if not self.done:
             self._apply_end_of_turn_effects()
@@ -1484,7 +1554,7 @@ class BattleEnv:
         mon.last_move_used = None
         mon.is_salt_cure = False
         if mon.status == "slp":
-            mon.volatiles["sleep_turns"] = random.randint(1, 3)
+            mon.volatiles.sleep_turns = self.rng.randint(1, 3)
         if mon.status == "tox":
             mon.toxic_counter = max(1, mon.toxic_counter or 1)
 
@@ -1495,9 +1565,10 @@ class BattleEnv:
 
     def _apply_end_of_turn_effects(self) -> None:
         field = self.state.field
+        deal = self._deal_damage
         for side in self.state.sides:
             mon = side.active[0]
-            mon.volatiles.pop("protect_active", None)
+            mon.volatiles.protect_active = None
 
         # Weather residual damage
         if field.weather in ("Sandstorm", "Hail", "Snow"):
@@ -1519,7 +1590,7 @@ class BattleEnv:
                     continue
 
                 dmg = max(1, mon.max_hp // 16)
-                self._deal_damage(mon, dmg)
+                deal(mon, dmg)
                 if self.done:
                     return
 
@@ -1542,14 +1613,14 @@ class BattleEnv:
 
             if mon.ability == "Solar Power" and field.has_weather("Sun"):
                 dmg = max(1, mon.max_hp // 8)
-                self._deal_damage(mon, dmg)
+                deal(mon, dmg)
             elif mon.ability == "Dry Skin":
                 if field.has_weather("Rain"):
                     heal = max(1, mon.max_hp // 8)
                     mon.current_hp = min(mon.max_hp, mon.current_hp + heal)
                 elif field.has_weather("Sun"):
                     dmg = max(1, mon.max_hp // 8)
-                    self._deal_damage(mon, dmg)
+                    deal(mon, dmg)
 
             if self.done:
                 return
@@ -1579,25 +1650,19 @@ class BattleEnv:
 
     def _tick_side_conditions(self) -> None:
         field = self.state.field
-        pairs = [
-            ("reflect", "reflect_turns"),
-            ("light_screen", "light_screen_turns"),
-            ("aurora_veil", "aurora_veil_turns"),
-            ("tailwind", "tailwind_turns"),
-        ]
-
-        for bool_attr, turn_attr in pairs:
-            active = getattr(field, bool_attr)
-            turns = getattr(field, turn_attr)
-            for idx in range(len(active)):
-                if not active[idx]:
-                    turns[idx] = 0
-                    continue
-                if turns[idx] <= 1:
-                    active[idx] = False
-                    turns[idx] = 0
+        flags = field.side_flags
+
+        for idx, counters in enumerate(field.side_counters):
+            side_flags = flags[idx]
+            for flag, counter in TIMED_SIDE_FLAGS:
+                if not side_flags & flag:
+                    counters[counter] = 0
+                elif counters[counter] <= 1:
+                    side_flags &= ~flag
+                    counters[counter] = 0
                 else:
-                    turns[idx] -= 1
+                    counters[counter] -= 1
+            flags[idx] = side_flags
 
     def _apply_status_and_volatile_effects(self) -> None:
         for side_idx, side in enumerate(self.state.sides):
@@ -1621,25 +1686,29 @@ class BattleEnv:
                 return
 
     def _apply_moody_boosts(self) -> None:
-        stats = ["Atk", "Def", "SpA", "SpD", "Spe", "Acc", "Eva"]
-        for side_idx, side in enumerate(self.state.sides):
+        for side in self.state.sides:
             mon = side.active[0]
             if mon.current_hp <= 0 or mon.ability != "Moody":
                 continue
 
-            up_candidates = [stat for stat in stats if mon.get_stage_value(stat) < 6]
-            if not up_candidates:
+            # Bit i set = MOODY_STATS[i] can still move in that direction.
+            up_mask = 0
+            down_mask = 0
+            for bit, stat in enumerate(MOODY_STATS):
+                stage = mon.get_stage_value(stat)
+                if stage < 6:
+                    up_mask |= 1 << bit
+                if stage > -6:
+                    down_mask |= 1 << bit
+
+            up_idx = _pick_masked_index(up_mask, self.state.rng)
+            if up_idx is None:
                 continue
+            self._boost_stat_stage(mon, MOODY_STATS[up_idx], 2)
 
-            up_stat = random.choice(up_candidates)
-            self._boost_stat_stage(mon, up_stat, 2)
-
-            down_candidates = [
-                stat for stat in stats if stat != up_stat and mon.get_stage_value(stat) > -6
-            ]
-            if down_candidates:
-                down_stat = random.choice(down_candidates)
-                self._boost_stat_stage(mon, down_stat, -1)
+            down_idx = _pick_masked_index(down_mask & ~(1 << up_idx), self.state.rng)
+            if down_idx is not None:
+                self._boost_stat_stage(mon, MOODY_STATS[down_idx], -1)
 
     def _apply_status_damage(self, mon: PokemonState, side_idx: int) -> None:
         if mon.current_hp <= 0:
@@ -1674,14 +1743,15 @@ class BattleEnv:
         if mon.current_hp <= 0:
             return
         magic_guard = mon.ability == "Magic Guard"
+        deal = self._deal_damage
 
-        seed_owner = mon.volatiles.get("leech_seed")
+        seed_owner = mon.volatiles.leech_seed
         if seed_owner is not None:
             if "Grass" in mon.types:
-                mon.volatiles.pop("leech_seed", None)
+                mon.volatiles.leech_seed = None
             elif not magic_guard and 0 <= seed_owner < len(self.state.sides):
                 dmg = max(1, mon.max_hp // 8)
-                healed = self._deal_damage(mon, dmg)
+                healed = deal(mon, dmg)
                 if healed > 0 and not self.done:
                     source_mon = self.state.sides[seed_owner].active[0]
                     if source_mon.current_hp > 0:
@@ -1691,13 +1761,13 @@ class BattleEnv:
             dmg = max(1, mon.max_hp // 8)
             if any(t in ("Water", "Steel") for t in mon.types):
                 dmg = max(1, dmg * 2)
-            self._deal_damage(mon, dmg)
+            deal(mon, dmg)
 
-        trap = mon.volatiles.get("partial_trap")
+        trap = mon.volatiles.partial_trap
         if trap:
             if not magic_guard and mon.current_hp > 0:
                 dmg = max(1, mon.max_hp // 8)
-                self._deal_damage(mon, dmg)
+                deal(mon, dmg)
             remaining = None
             if isinstance(trap, dict):
                 remaining = trap.get("turns", 0) - 1
@@ -1705,33 +1775,33 @@ class BattleEnv:
                 remaining = trap - 1
             if remaining is not None:
                 if remaining <= 0:
-                    mon.volatiles.pop("partial_trap", None)
+                    mon.volatiles.partial_trap = None
                 else:
                     if isinstance(trap, dict):
                         trap["turns"] = remaining
                     else:
-                        mon.volatiles["partial_trap"] = remaining
+                        mon.volatiles.partial_trap = remaining
 
     def _tick_volatile_timers(self, mon: PokemonState) -> None:
-        taunt = mon.volatiles.get("taunt_turns")
+        taunt = mon.volatiles.taunt_turns
         if taunt:
             taunt -= 1
             if taunt <= 0:
-                mon.volatiles.pop("taunt_turns", None)
+                mon.volatiles.taunt_turns = None
             else:
-                mon.volatiles["taunt_turns"] = taunt
+                mon.volatiles.taunt_turns = taunt
 
-        encore = mon.volatiles.get("encore")
+        encore = mon.volatiles.encore
         if encore:
             encore["turns"] = max(0, encore.get("turns", 0) - 1)
             if encore["turns"] <= 0:
-                mon.volatiles.pop("encore", None)
+                mon.volatiles.encore = None
 
-        disable = mon.volatiles.get("disable")
+        disable = mon.volatiles.disable
         if disable:
             disable["turns"] = max(0, disable.get("turns", 0) - 1)
             if disable["turns"] <= 0:
-                mon.volatiles.pop("disable", None)
+                mon.volatiles.disable = None
 
     def _apply_item_residuals(self, mon: PokemonState) -> None:
         if mon.current_hp <= 0 or not mon.item:
@@ -1746,4 +1816,13 @@ class BattleEnv:
                 mon.current_hp = min(mon.max_hp, mon.current_hp + heal)
             elif mon.ability != "Magic Guard":
                 dmg = max(1, mon.max_hp // 8)
-                self._deal_damage(mon, dmg)
\ No newline at end of file
+                self._deal_damage(mon, dmg)
+
+
+# Per-category action handlers for apply_turn; built once at import so the
+# per-actor body is a single dict lookup instead of a category if/else.
+MOVE_HANDLERS = {
+    "Status": BattleEnv._handle_status_move,
+    "Physical": BattleEnv._handle_damaging_move,
+    "Special": BattleEnv._handle_damaging_move,
+}
@@ -1,8 +1,26 @@
 # move_effects.py
 from dataclasses import dataclass
-from typing import Literal, Optional, List, Dict, Tuple
-from state import BattleState, PokemonState
+from typing import Any, Callable, Literal, Optional, List, Dict, Sequence, Tuple
+from data_loader import move_id_for
+from state import (
+    BattleState,
+    PokemonState,
+    COUNTER_AURORA_VEIL,
+    COUNTER_LIGHT_SCREEN,
+    COUNTER_REFLECT,
+    COUNTER_TAILWIND,
+    SIDE_AURORA_VEIL,
+    SIDE_LIGHT_SCREEN,
+    SIDE_REFLECT,
+    SIDE_STEALTH_ROCK,
+    SIDE_STEELSURGE,
+    SIDE_STICKY_WEB,
+    SIDE_TAILWIND,
+)
 import random
+import sys
+
+import numpy as np
 
 
 EffectKind = Literal[
@@ -27,7 +45,7 @@ EffectTarget = Literal[
 ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EffectSpec:
     kind: EffectKind
     target: EffectTarget
@@ -286,7 +304,7 @@ MOVE_EFFECTS: Dict[str, List[EffectSpec]] = {
         EffectSpec(kind="weather", target="field", condition="Sun", duration=5)
     ],
     "Sandstorm": [
-        EffectSpec(kind="weather", target="field", condition="Sand", duration=5)
+        EffectSpec(kind="weather", target="field", condition="Sandstorm", duration=5)
     ],
     "Hail": [
         EffectSpec(kind="weather", target="field", condition="Hail", duration=5)
@@ -393,155 +411,199 @@ MOVE_EFFECTS: Dict[str, List[EffectSpec]] = {
         EffectSpec(kind="phaze", target="foe")
     ],
 }
+
+
+def intern_move_effects(
+    move_effects: Dict[str, Sequence[EffectSpec]],
+) -> Dict[str, Tuple[EffectSpec, ...]]:
+    # Flyweight pass: equal specs and equal effect lists share one object.
+    spec_pool: Dict[EffectSpec, EffectSpec] = {}
+    list_pool: Dict[Tuple[EffectSpec, ...], Tuple[EffectSpec, ...]] = {}
+    interned: Dict[str, Tuple[EffectSpec, ...]] = {}
+    for move_name, specs in move_effects.items():
+        key = tuple(spec_pool.setdefault(spec, spec) for spec in specs)
+        interned[move_name] = list_pool.setdefault(key, key)
+    return interned
+
+
+MOVE_EFFECTS: Dict[str, Tuple[EffectSpec, ...]] = intern_move_effects(MOVE_EFFECTS)
 # move_effects.py (continued)
 
-def _clamp_stage(stage: int) -> int:
-    return max(-6, min(6, stage))
+# Every compiled handler shares the signature
+#   handler(state, attacker, defender, actor_side_idx, *args)
+# so apply_effects_for_move can call it without inspecting the spec.
+EffectHandler = Callable[..., None]
+AlwaysEffect = Tuple[EffectHandler, Tuple[Any, ...]]
+ChanceEffect = Tuple[int, EffectHandler, Tuple[Any, ...]]
+# (effects that always fire, (chance, ...) effects that need a roll)
+CompiledMoveEffects = Tuple[Tuple[AlwaysEffect, ...], Tuple[ChanceEffect, ...]]
+
+
+# Alternate hazard spellings, folded to the canonical name at compile time.
+HAZARD_ALIASES: Dict[str, str] = {"stealth_rocks": "stealth_rock"}
+
+# Effect rolls are drawn from a pre-generated batch of uniforms instead of
+# one random.randint call each. The batch lives on the BattleState and is
+# seeded from the battle's rng when it is (lazily) refilled, so a seeded
+# state.rng, or random.seed() when it is unset, keeps battles reproducible.
+_ROLL_BATCH_SIZE = 4096
+
 
+def _next_uniform(state: BattleState) -> float:
+    buf = state.roll_buffer
+    pos = state.roll_pos
+    if pos >= len(buf):
+        rng = random if state.rng is None else state.rng
+        buf = np.random.default_rng(rng.getrandbits(64)).random(_ROLL_BATCH_SIZE).tolist()
+        state.roll_buffer = buf
+        pos = 0
+    state.roll_pos = pos + 1
+    return buf[pos]
 
-def _get_side_indices(actor_side_idx: int) -> Tuple[int, int]:
-    actor = actor_side_idx
-    foe = 1 - actor_side_idx
-    return actor, foe
+
+def _roll_percent(state: BattleState) -> int:
+    return int(_next_uniform(state) * 100) + 1
+
+
+def _clamp_stage(stage: int) -> int:
+    return max(-6, min(6, stage))
 
 
 def _apply_stat_stage(
     pokemon: PokemonState,
-    spec: EffectSpec,
+    stat: str,
+    stages: int,
     source: PokemonState,
 ) -> None:
-    if spec.stat is None or spec.stages == 0:
-        return
     pokemon.change_stat_stage(
-        spec.stat,
-        spec.stages,
+        stat,
+        stages,
         source=source,
         from_opponent=source is not pokemon,
     )
 
 
+def _stat_stage_self(state, attacker, defender, actor_side_idx, stat, stages) -> None:
+    _apply_stat_stage(attacker, stat, stages, attacker)
+
+
+def _stat_stage_foe(state, attacker, defender, actor_side_idx, stat, stages) -> None:
+    _apply_stat_stage(defender, stat, stages, attacker)
+
+
 def _apply_status(
     state: BattleState,
     pokemon: PokemonState,
-    spec: EffectSpec,
-    target_side_idx: int,
+    status: str,
 ) -> None:
-    if spec.status is None:
-        return
     field = state.field
     grounded = pokemon.is_grounded(field)
 
     if grounded and field.has_terrain("Misty"):
         return
-    if grounded and spec.status == "slp" and field.has_terrain("Electric"):
+    if grounded and status == "slp" and field.has_terrain("Electric"):
         return
 
-    pokemon.apply_status(spec.status)
+    pokemon.apply_status(status, state.rng)
 
 
-def _apply_hazard(
-    state: BattleState,
-    actor_side_idx: int,
-    spec: EffectSpec,
-) -> None:
-    actor_idx, foe_idx = _get_side_indices(actor_side_idx)
-    if spec.target == "self_side":
-        idx = actor_idx
-    elif spec.target == "foe_side":
-        idx = foe_idx
-    else:
-        idx = foe_idx
-
-    hazard_name = spec.hazard or spec.condition
-    if not hazard_name:
-        return
-    hazard_name = hazard_name.lower()
+def _status_self(state, attacker, defender, actor_side_idx, status) -> None:
+    _apply_status(state, attacker, status)
 
-    if hazard_name in ("stealth_rock", "stealth_rocks"):
-        state.field.stealth_rocks[idx] = True
-    elif hazard_name == "spikes":
-        state.field.spikes[idx] = min(3, state.field.spikes[idx] + 1)
-    elif hazard_name == "toxic_spikes":
-        state.field.toxic_spikes[idx] = min(2, state.field.toxic_spikes[idx] + 1)
-    elif hazard_name == "sticky_web":
-        state.field.sticky_web[idx] = True
-    elif hazard_name == "steelsurge":
-        state.field.steelsurge[idx] = True
 
+def _status_foe(state, attacker, defender, actor_side_idx, status) -> None:
+    _apply_status(state, defender, status)
 
-def _apply_side_condition(
-    state: BattleState,
-    actor_side_idx: int,
-    spec: EffectSpec,
-    source: Optional[PokemonState] = None,
-) -> None:
-    actor_idx, foe_idx = _get_side_indices(actor_side_idx)
-    if spec.target == "self_side":
-        idx = actor_idx
-    elif spec.target == "foe_side":
-        idx = foe_idx
-    else:
-        idx = actor_idx
-
-    duration = spec.duration or 0
-    if spec.side_condition in ("reflect", "light_screen", "aurora_veil"):
-        if source and source.item == "Light Clay":
+
+def _set_stealth_rock(state, attacker, defender, actor_side_idx, on_foe_side) -> None:
+    idx = 1 - actor_side_idx if on_foe_side else actor_side_idx
+    state.field.side_flags[idx] |= SIDE_STEALTH_ROCK
+
+
+def _add_spikes(state, attacker, defender, actor_side_idx, on_foe_side) -> None:
+    idx = 1 - actor_side_idx if on_foe_side else actor_side_idx
+    state.field.spikes[idx] = min(3, state.field.spikes[idx] + 1)
+
+
+def _add_toxic_spikes(state, attacker, defender, actor_side_idx, on_foe_side) -> None:
+    idx = 1 - actor_side_idx if on_foe_side else actor_side_idx
+    state.field.toxic_spikes[idx] = min(2, state.field.toxic_spikes[idx] + 1)
+
+
+def _set_sticky_web(state, attacker, defender, actor_side_idx, on_foe_side) -> None:
+    idx = 1 - actor_side_idx if on_foe_side else actor_side_idx
+    state.field.side_flags[idx] |= SIDE_STICKY_WEB
+
+
+def _set_steelsurge(state, attacker, defender, actor_side_idx, on_foe_side) -> None:
+    idx = 1 - actor_side_idx if on_foe_side else actor_side_idx
+    state.field.side_flags[idx] |= SIDE_STEELSURGE
+
+
+_HAZARD_HANDLERS: Dict[str, EffectHandler] = {
+    "stealth_rock": _set_stealth_rock,
+    "spikes": _add_spikes,
+    "toxic_spikes": _add_toxic_spikes,
+    "sticky_web": _set_sticky_web,
+    "steelsurge": _set_steelsurge,
+}
+
+
+def _apply_side_condition(state, attacker, defender, actor_side_idx, on_foe_side, condition, duration) -> None:
+    idx = 1 - actor_side_idx if on_foe_side else actor_side_idx
+
+    if condition in ("reflect", "light_screen", "aurora_veil"):
+        if attacker is not None and attacker.item == "Light Clay":
             duration += 3
 
-    if spec.side_condition == "reflect":
-        state.field.reflect[idx] = True
-        state.field.reflect_turns[idx] = duration
-    elif spec.side_condition == "light_screen":
-        state.field.light_screen[idx] = True
-        state.field.light_screen_turns[idx] = duration
-    elif spec.side_condition == "aurora_veil":
-        state.field.aurora_veil[idx] = True
-        state.field.aurora_veil_turns[idx] = duration
-    elif spec.side_condition == "tailwind":
-        state.field.tailwind[idx] = True
-        state.field.tailwind_turns[idx] = duration or 4
-
-
-def _apply_weather(
-    state: BattleState,
-    spec: EffectSpec,
-) -> None:
-    if spec.weather is None:
-        return
-    if spec.weather == "rain":
-        state.field.weather = "Rain"
-    elif spec.weather == "sun":
-        state.field.weather = "Sun"
-    elif spec.weather == "sand":
-        state.field.weather = "Sand"
-    elif spec.weather == "hail":
-        state.field.weather = "Hail"
-    
+    if condition == "reflect":
+        state.field.side_flags[idx] |= SIDE_REFLECT
+        state.field.side_counters[idx][COUNTER_REFLECT] = duration
+    elif condition == "light_screen":
+        state.field.side_flags[idx] |= SIDE_LIGHT_SCREEN
+        state.field.side_counters[idx][COUNTER_LIGHT_SCREEN] = duration
+    elif condition == "aurora_veil":
+        state.field.side_flags[idx] |= SIDE_AURORA_VEIL
+        state.field.side_counters[idx][COUNTER_AURORA_VEIL] = duration
+    elif condition == "tailwind":
+        state.field.side_flags[idx] |= SIDE_TAILWIND
+        state.field.side_counters[idx][COUNTER_TAILWIND] = duration or 4
+
+
+def _apply_weather(state, attacker, defender, actor_side_idx, weather, duration) -> None:
+    state.field.weather = weather
+    state.field.weather_turns = duration
+
+
+def _apply_terrain(state, attacker, defender, actor_side_idx, terrain, duration) -> None:
+    state.field.terrain = terrain
+    state.field.terrain_turns = duration
+
 
 def _apply_heal(
     pokemon: PokemonState,
-    spec: EffectSpec,
+    percent: int,
     weather: Optional[str],
 ) -> None:
-    if spec.heal_fraction is None:
-        return
+    frac = percent / 100
 
-    num, den = spec.heal_fraction
-    frac = num / den
-
-    if frac == 0.5 and weather in ("Sun", "Sand", "Hail", "Rain"):
+    if frac == 0.5 and weather in ("Sun", "Sandstorm", "Hail", "Rain"):
         frac = 1 / 3
 
     amount = int(pokemon.max_hp * frac)
     pokemon.current_hp = min(pokemon.max_hp, pokemon.current_hp + max(1, amount))
 
 
-def _apply_protect(
-    state: BattleState,
-    actor_side_idx: int,
-) -> None:
-    actor_idx, _ = _get_side_indices(actor_side_idx)
-    state.field.protect[actor_idx] = True
+def _heal_self(state, attacker, defender, actor_side_idx, percent) -> None:
+    _apply_heal(attacker, percent, state.field.weather)
+
+
+def _heal_foe(state, attacker, defender, actor_side_idx, percent) -> None:
+    _apply_heal(defender, percent, state.field.weather)
+
+
+def _apply_protect(state, attacker, defender, actor_side_idx) -> None:
+    attacker.volatiles.protect_active = True
 
 
 def _apply_substitute(
@@ -556,78 +618,140 @@ def _apply_substitute(
     pokemon.substitute_hp = hp
 
 
-def _apply_phaze(
-    state: BattleState,
-    actor_side_idx: int,
-) -> None:
-    foe_idx = 1 - actor_side_idx
-    side = state.sides[foe_idx]
-    if len(side.bench) == 0:
-        return
-    if side.active[0].current_hp <= 0:
-        return
-    new_idx = random.randrange(len(side.bench))
-    side.active[0], side.bench[new_idx] = side.bench[new_idx], side.active[0]
+def _substitute_self(state, attacker, defender, actor_side_idx) -> None:
+    _apply_substitute(attacker)
+
+
+def _substitute_foe(state, attacker, defender, actor_side_idx) -> None:
+    _apply_substitute(defender)
+
+
+def _compile_spec(spec: EffectSpec) -> Optional[Tuple[EffectHandler, Tuple[Any, ...]]]:
+    kind = spec.kind
+    on_self = spec.target == "self"
+    on_foe = spec.target == "foe"
+
+    if kind == "stat_stage":
+        if spec.stat is None or spec.stages == 0:
+            return None
+        if on_self:
+            return _stat_stage_self, (spec.stat, spec.stages)
+        if on_foe:
+            return _stat_stage_foe, (spec.stat, spec.stages)
+    elif kind == "status":
+        if spec.status is None:
+            return None
+        if on_self:
+            return _status_self, (spec.status,)
+        if on_foe:
+            return _status_foe, (spec.status,)
+    elif kind == "hazard":
+        hazard_name = spec.hazard or spec.condition
+        if not hazard_name:
+            return None
+        hazard_name = hazard_name.lower()
+        handler = _HAZARD_HANDLERS.get(HAZARD_ALIASES.get(hazard_name, hazard_name))
+        if handler is None:
+            return None
+        return handler, (spec.target != "self_side",)
+    elif kind == "side_condition":
+        if spec.condition is None:
+            return None
+        return _apply_side_condition, (spec.target == "foe_side", spec.condition, spec.duration or 0)
+    elif kind == "weather":
+        if spec.condition is None:
+            return None
+        return _apply_weather, (spec.condition, spec.duration or 0)
+    elif kind == "terrain":
+        if spec.condition is None:
+            return None
+        return _apply_terrain, (spec.condition, spec.duration or 0)
+    elif kind == "heal":
+        if spec.amount is None:
+            return None
+        if on_self:
+            return _heal_self, (spec.amount,)
+        if on_foe:
+            return _heal_foe, (spec.amount,)
+    elif kind == "protect":
+        return _apply_protect, ()
+    elif kind == "substitute":
+        if on_self:
+            return _substitute_self, ()
+        if on_foe:
+            return _substitute_foe, ()
+    # "phaze" compiles to nothing: BattleEnv._handle_phazing_move does the
+    # forced switch once the hit's item hooks have run.
+    return None
+
+
+def compile_move_effects(
+    move_effects: Dict[str, Sequence[EffectSpec]],
+) -> Dict[str, CompiledMoveEffects]:
+    compiled: Dict[str, CompiledMoveEffects] = {}
+    # Moves with equal spec tuples share a single compiled entry.
+    pool: Dict[Tuple[EffectSpec, ...], Optional[CompiledMoveEffects]] = {}
+    for move_name, specs in move_effects.items():
+        key = tuple(specs)
+        if key in pool:
+            shared = pool[key]
+            if shared is not None:
+                compiled[sys.intern(move_name)] = shared
+            continue
+        always: List[AlwaysEffect] = []
+        chanced: List[ChanceEffect] = []
+        for spec in specs:
+            resolved = _compile_spec(spec)
+            if resolved is None:
+                continue
+            handler, args = resolved
+            if spec.chance >= 100:
+                always.append((handler, args))
+            else:
+                chanced.append((spec.chance, handler, args))
+        entry = (tuple(always), tuple(chanced)) if always or chanced else None
+        pool[key] = entry
+        if entry is not None:
+            # Interned keys let lookups with interned MoveData names match
+            # on identity before falling back to a character compare.
+            compiled[sys.intern(move_name)] = entry
+    return compiled
+
+
+COMPILED_EFFECTS: Dict[str, CompiledMoveEffects] = compile_move_effects(MOVE_EFFECTS)
+
+_NO_EFFECTS: CompiledMoveEffects = ((), ())
+
+
+def index_effects_by_id(
+    compiled: Dict[str, CompiledMoveEffects],
+) -> List[CompiledMoveEffects]:
+    by_id = {move_id_for(name): effects for name, effects in compiled.items()}
+    table = [_NO_EFFECTS] * (max(by_id) + 1 if by_id else 0)
+    for move_id, effects in by_id.items():
+        table[move_id] = effects
+    return table
+
+
+# Moves first seen after import get ids past the end and have no effects.
+COMPILED_EFFECTS_BY_ID: List[CompiledMoveEffects] = index_effects_by_id(COMPILED_EFFECTS)
 
 
 def apply_effects_for_move(
     state: BattleState,
     attacker: PokemonState,
     defender: PokemonState,
-    move_name: str,
+    move_id: int,
     actor_side_idx: int,
     success: bool,
 ) -> None:
-    if not success:
+    if not success or move_id >= len(COMPILED_EFFECTS_BY_ID):
         return
 
-    effects = MOVE_EFFECTS.get(move_name)
-    if not effects:
-        return
-
-    actor_idx, foe_idx = _get_side_indices(actor_side_idx)
-
-    for spec in effects:
-        if spec.chance < 100:
-            roll = random.randint(1, 100)
-            if roll > spec.chance:
-                continue
-
-        if spec.kind == "stat_stage":
-            if spec.target == "self":
-                _apply_stat_stage(attacker, spec, attacker)
-            elif spec.target == "foe":
-                _apply_stat_stage(defender, spec, attacker)
-
-        elif spec.kind == "status":
-            if spec.target == "self":
-                _apply_status(state, attacker, spec, actor_idx)
-            elif spec.target == "foe":
-                _apply_status(state, defender, spec, foe_idx)
-
-        elif spec.kind == "hazard":
-            _apply_hazard(state, actor_side_idx, spec)
-
-        elif spec.kind == "side_condition":
-            _apply_side_condition(state, actor_side_idx, spec, attacker)
-
-        elif spec.kind == "weather":
-            _apply_weather(state, spec)
-
-        elif spec.kind == "heal":
-            if spec.target == "self":
-                _apply_heal(attacker, spec, state.field.weather)
-            elif spec.target == "foe":
-                _apply_heal(defender, spec, state.field.weather)
-
-        elif spec.kind == "protect":
-            _apply_protect(state, actor_side_idx)
-
-        elif spec.kind == "substitute":
-            if spec.target == "self":
-                _apply_substitute(attacker)
-            elif spec.target == "foe":
-                _apply_substitute(defender)
-
-        elif spec.kind == "phaze":
-            _apply_phaze(state, actor_side_idx)
\ No newline at end of file
+    always, chanced = COMPILED_EFFECTS_BY_ID[move_id]
+    for handler, args in always:
+        handler(state, attacker, defender, actor_side_idx, *args)
+    if chanced:
+        for chance, handler, args in chanced:
+            if _roll_percent(state) <= chance:
+                handler(state, attacker, defender, actor_side_idx, *args)
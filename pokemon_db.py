@@ -1,16 +1,54 @@
 from __future__ import annotations
 
+import json
+import sqlite3
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Set, Tuple, Optional
+from urllib.robotparser import RobotFileParser
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
 
 from species_index import RUNANDBUN_SPECIES, MOVE_TO_SPECIES
 
 POKEDEX_BASE_URL = "https://pokemondb.net/pokedex/"
+POKEDEX_ROBOTS_URL = "https://pokemondb.net/robots.txt"
 CRAWL_DELAY_SECONDS = 4.0
+MAX_FETCH_WORKERS = 4
+POKEDEX_CACHE_PATH = "pokedex_cache.db"
+
+CachedMoves = Tuple[Optional[str], Set[str]]
+
+
+class RateLimiter:
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def crawl_delay_from_robots(default: float = CRAWL_DELAY_SECONDS) -> float:
+    parser = RobotFileParser(POKEDEX_ROBOTS_URL)
+    try:
+        parser.read()
+    except Exception:
+        return default
+    delay = parser.crawl_delay("*")
+    if delay is None:
+        return default
+    return max(float(delay), default)
 
 
 def slug_for_species(name: str, base_species: Optional[str]) -> str:
@@ -32,47 +70,70 @@ def slug_for_species(name: str, base_species: Optional[str]) -> str:
 
 
 def extract_moves_from_table(table) -> Set[str]:
-    moves: Set[str] = set()
-    thead = table.find("thead")
-    if not thead:
-        return moves
-    header_cells = thead.find_all("th")
-    headers = [h.get_text(strip=True) for h in header_cells]
+    headers = [th.text_content().strip() for th in table.xpath("./thead[1]//th")]
     if "Move" not in headers:
-        return moves
-    move_idx = headers.index("Move")
-    body = table.find("tbody")
-    if not body:
-        return moves
-    for row in body.find_all("tr"):
-        cells = row.find_all("td")
-        if len(cells) <= move_idx:
-            continue
-        move_cell = cells[move_idx]
-        link = move_cell.find("a")
-        if link:
-            move_name = link.get_text(strip=True)
-            if move_name:
-                moves.add(move_name)
-    return moves
+        return set()
+    move_col = headers.index("Move") + 1
+    links = table.xpath(f"./tbody[1]/tr/td[{move_col}]/descendant::a[1]")
+    return {name for name in (a.text_content().strip() for a in links) if name}
+
+
+def parse_pokemondb_moves(html: str) -> Set[str]:
+    root = lxml.html.fromstring(html)
+    all_moves: Set[str] = set()
+    for table in root.iter("table"):
+        all_moves |= extract_moves_from_table(table)
+    return all_moves
 
 
-def fetch_pokemondb_moves(slug: str) -> Set[str]:
+def fetch_pokemondb_moves(
+    slug: str,
+    session: Optional[requests.Session] = None,
+    limiter: Optional[RateLimiter] = None,
+    etag: Optional[str] = None,
+) -> Tuple[Optional[str], Optional[Set[str]]]:
+    # moves is None when the page is unchanged (304) or the fetch failed.
     url = POKEDEX_BASE_URL + slug
+    headers = {"If-None-Match": etag} if etag else None
+    if limiter is not None:
+        limiter.wait()
     print(f"Fetching moves from {url} ...")
     try:
-        resp = requests.get(url, timeout=15)
+        resp = (session or requests).get(url, headers=headers, timeout=15)
+        if resp.status_code == 304:
+            print(f"  -> '{slug}' not modified, using cached moves")
+            return etag, None
         resp.raise_for_status()
     except Exception as exc:
         print(f"  ! Failed to fetch {url}: {exc}")
-        return set()
+        return etag, None
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    all_moves: Set[str] = set()
-    for table in soup.find_all("table"):
-        all_moves |= extract_moves_from_table(table)
+    all_moves = parse_pokemondb_moves(resp.text)
     print(f"  -> Found {len(all_moves)} moves on PokémonDB for slug '{slug}'")
-    return all_moves
+    return resp.headers.get("ETag"), all_moves
+
+
+def open_moves_cache(path: str = POKEDEX_CACHE_PATH) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pokemondb_moves "
+        "(slug TEXT PRIMARY KEY, etag TEXT, moves TEXT)"
+    )
+    return conn
+
+
+def load_cached_moves(conn: sqlite3.Connection) -> Dict[str, CachedMoves]:
+    rows = conn.execute("SELECT slug, etag, moves FROM pokemondb_moves")
+    return {slug: (etag, set(json.loads(moves))) for slug, etag, moves in rows}
+
+
+def store_cached_moves(
+    conn: sqlite3.Connection, slug: str, etag: Optional[str], moves: Set[str]
+) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO pokemondb_moves (slug, etag, moves) VALUES (?, ?, ?)",
+        (slug, etag, json.dumps(sorted(moves))),
+    )
 
 
 def build_pokemon_to_moves_from_runandbun() -> Dict[str, Set[str]]:
@@ -83,9 +144,16 @@ def build_pokemon_to_moves_from_runandbun() -> Dict[str, Set[str]]:
     return pokemon_to_moves
 
 
-def build_pokemondb_cache() -> Dict[str, Set[str]]:
+def build_pokemondb_cache(
+    max_workers: int = MAX_FETCH_WORKERS,
+    cache_path: str = POKEDEX_CACHE_PATH,
+    revalidate: bool = False,
+) -> Dict[str, Set[str]]:
+    # Cached slugs skip HTTP entirely unless revalidate is set, in which case
+    # they are re-requested with If-None-Match on their stored ETag.
     cache: Dict[str, Set[str]] = {}
     seen_slugs: Set[str] = set()
+    jobs: Dict[str, str] = {}
 
     for name, info in RUNANDBUN_SPECIES.items():
         base_name = info.base_species or info.name
@@ -93,10 +161,39 @@ def build_pokemondb_cache() -> Dict[str, Set[str]]:
         if slug in seen_slugs:
             continue
         seen_slugs.add(slug)
-        if base_name in cache:
+        if base_name in jobs:
             continue
-        cache[base_name] = fetch_pokemondb_moves(slug)
-        time.sleep(CRAWL_DELAY_SECONDS)
+        jobs[base_name] = slug
+
+    conn = open_moves_cache(cache_path)
+    try:
+        stored = load_cached_moves(conn)
+        to_fetch: Dict[str, str] = {}
+        for base_name, slug in jobs.items():
+            if slug in stored and not revalidate:
+                cache[base_name] = stored[slug][1]
+            else:
+                to_fetch[base_name] = slug
+
+        if to_fetch:
+            limiter = RateLimiter(crawl_delay_from_robots())
+            with requests.Session() as session, ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {}
+                for base_name, slug in to_fetch.items():
+                    etag = stored[slug][0] if slug in stored else None
+                    future = pool.submit(fetch_pokemondb_moves, slug, session, limiter, etag)
+                    futures[future] = (base_name, slug)
+                for future in as_completed(futures):
+                    base_name, slug = futures[future]
+                    etag, moves = future.result()
+                    if moves is None:
+                        moves = stored[slug][1] if slug in stored else set()
+                    else:
+                        store_cached_moves(conn, slug, etag, moves)
+                    cache[base_name] = moves
+            conn.commit()
+    finally:
+        conn.close()
 
     return cache
 
@@ -127,15 +224,24 @@ def write_python_module(
     pokemon_to_moves: Dict[str, List[str]],
     path: str = "moves_index.py",
 ) -> None:
+    move_reprs: Dict[str, str] = {}
+    for moves in pokemon_to_moves.values():
+        for m in moves:
+            if m not in move_reprs:
+                move_reprs[m] = repr(m)
+
+    lines = [
+        "from __future__ import annotations\n\n",
+        "from typing import Dict, Tuple\n\n",
+        "POKEMON_TO_MOVES: Dict[str, Tuple[str, ...]] = {\n",
+    ]
+    for name in sorted(pokemon_to_moves.keys()):
+        move_list_literal = ", ".join([move_reprs[m] for m in pokemon_to_moves[name]])
+        lines.append(f"    {name!r}: ({move_list_literal}),\n")
+    lines.append("}\n")
+
     with open(path, "w", encoding="utf8") as f:
-        f.write("from __future__ import annotations\n\n")
-        f.write("from typing import Dict, Tuple\n\n")
-        f.write("POKEMON_TO_MOVES: Dict[str, Tuple[str, ...]] = {\n")
-        for name in sorted(pokemon_to_moves.keys()):
-            moves = pokemon_to_moves[name]
-            move_list_literal = ", ".join(repr(m) for m in moves)
-            f.write(f"    {name!r}: ({move_list_literal}),\n")
-        f.write("}\n")
+        f.write("".join(lines))
 
 
 def main() -> None:
@@ -1,21 +1,278 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Literal, TYPE_CHECKING
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterator, List, Optional, Literal, Tuple, TYPE_CHECKING
 import random
+import sys
 
 if TYPE_CHECKING:
     from data_loader import MoveData
 
 
 STAT_NAMES = ("HP", "Atk", "Def", "SpA", "SpD", "Spe")
+STAT_IDX: Dict[str, int] = {name: i for i, name in enumerate(STAT_NAMES)}
+_NON_HP_STATS = STAT_NAMES[1:]
+# stat_stages index; HP has no stage, so this is STAT_IDX shifted by one.
+STAGE_IDX: Dict[str, int] = {name: i for i, name in enumerate(_NON_HP_STATS)}
+_SPE_STAGE = STAGE_IDX["Spe"]
+
+
+# nature -> (raised stat, lowered stat)
+_NATURE_TABLE: Dict[str, Tuple[str, str]] = {
+    # Atk+ natures
+    "Lonely": ("Atk", "Def"),
+    "Brave": ("Atk", "Spe"),
+    "Adamant": ("Atk", "SpA"),
+    "Naughty": ("Atk", "SpD"),
+    # Def+ natures
+    "Bold": ("Def", "Atk"),
+    "Relaxed": ("Def", "Spe"),
+    "Impish": ("Def", "SpA"),
+    "Lax": ("Def", "SpD"),
+    # Spe+ natures
+    "Timid": ("Spe", "Atk"),
+    "Hasty": ("Spe", "Def"),
+    "Jolly": ("Spe", "SpA"),
+    "Naive": ("Spe", "SpD"),
+    # SpA+ natures
+    "Modest": ("SpA", "Atk"),
+    "Mild": ("SpA", "Def"),
+    "Quiet": ("SpA", "Spe"),
+    "Rash": ("SpA", "SpD"),
+    # SpD+ natures
+    "Calm": ("SpD", "Atk"),
+    "Gentle": ("SpD", "Def"),
+    "Sassy": ("SpD", "Spe"),
+    "Careful": ("SpD", "SpA"),
+}
+
+
+def _nature_percents(inc: str, dec: str) -> Tuple[int, ...]:
+    return tuple(
+        110 if stat == inc else 90 if stat == dec else 100 for stat in STAT_NAMES
+    )
+
+
+# nature -> percent multiplier per stat, indexed by STAT_IDX.
+NATURE_MULT: Dict[str, Tuple[int, ...]] = {
+    nature: _nature_percents(inc, dec) for nature, (inc, dec) in _NATURE_TABLE.items()
+}
+NEUTRAL_NATURE_MULT: Tuple[int, ...] = (100,) * len(STAT_NAMES)
+
+
+# Stat stage multipliers 2/8 .. 8/2, indexed by stage + 6.
+_STAGE_NUM = (2, 2, 2, 2, 2, 2, 2, 3, 4, 5, 6, 7, 8)
+_STAGE_DEN = (8, 7, 6, 5, 4, 3, 2, 2, 2, 2, 2, 2, 2)
+
+
+def _unboosted_stat(base: int, iv: int, level: int, nature_pct: int) -> int:
+    ev = 0  # Run & Bun: EVs are removed
+    raw = ((2 * base + iv + ev // 4) * level // 100) + 5
+    if nature_pct != 100:
+        raw = (raw * nature_pct) // 100
+    return raw
+
+
+def _staged_stat(raw: int, stage: int, marvel_scale: bool) -> int:
+    if stage > 6:
+        stage = 6
+    elif stage < -6:
+        stage = -6
+    raw = raw * _STAGE_NUM[stage + 6] // _STAGE_DEN[stage + 6]
+
+    if marvel_scale:
+        raw = raw * 3 // 2
+    return max(1, raw)
+
+
+_UNSET: Any = object()
+
+_INTIMIDATE_IMMUNE = frozenset(("Own Tempo", "Oblivious", "Scrappy", "Inner Focus"))
+_STAT_DROP_BLOCKERS = frozenset(("Clear Body", "White Smoke", "Full Metal Body"))
+
+# Stage-stat spelling -> canonical name; canonical names map to themselves so
+# the common case is a single probe with no str.lower() allocation.
+_STAT_ALIAS: Dict[str, str] = {
+    "atk": "Atk",
+    "attack": "Atk",
+    "def": "Def",
+    "defense": "Def",
+    "spa": "SpA",
+    "spatk": "SpA",
+    "spd": "SpD",
+    "spdef": "SpD",
+    "spe": "Spe",
+    "speed": "Spe",
+    "acc": "accuracy",
+    "accuracy": "accuracy",
+    "eva": "evasion",
+    "evasion": "evasion",
+}
+_STAT_ALIAS.update({name: name for name in STAGE_IDX})
+
+
+def _canonical_stage_stat(stat: str) -> str:
+    canonical = _STAT_ALIAS.get(stat)
+    if canonical is None:
+        canonical = _STAT_ALIAS.get(stat.lower(), stat)
+    return canonical
+
+# Templates copied by PokemonState's default factories.
+_IV_DEFAULT: List[int] = [31] * len(STAT_NAMES)
+_EV_DEFAULT: List[int] = [0] * len(STAT_NAMES)
+_STAGES_DEFAULT: List[int] = [0] * len(_NON_HP_STATS)
+
+
+def _stat_vector(values: Any, default: int, stats: Tuple[str, ...] = STAT_NAMES) -> List[int]:
+    if isinstance(values, dict):
+        return [values.get(stat, default) for stat in stats]
+    return list(values)
+
+
+class StageView(MutableMapping):
+    # Dict-style view of a PokemonState's stat_stages list, keyed by stat name.
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "PokemonState") -> None:
+        self._owner = owner
+
+    def __getitem__(self, stat: str) -> int:
+        return self._owner.stat_stages[STAGE_IDX[stat]]
+
+    def __setitem__(self, stat: str, value: int) -> None:
+        self._owner.stat_stages[STAGE_IDX[stat]] = value
+
+    def __delitem__(self, stat: str) -> None:
+        raise TypeError("stat stages cannot be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_NON_HP_STATS)
+
+    def __len__(self) -> int:
+        return len(_NON_HP_STATS)
+
+    def copy(self) -> Dict[str, int]:
+        return dict(zip(_NON_HP_STATS, self._owner.stat_stages))
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
+@dataclass(slots=True, repr=False)
+class Volatiles:
+    # One slot per known volatile condition; None means "not set". Hot
+    # paths read the attributes directly, while the dict-style methods
+    # below keep string-keyed callers (Baton Pass, switch-out clearing)
+    # working. Unknown keys land in an overflow dict.
+    protect_active: Optional[bool] = None
+    protect_streak: Optional[int] = None
+    sleep_turns: Optional[int] = None
+    frozen: Optional[bool] = None
+    flinch: Optional[bool] = None
+    confusion_turns: Optional[int] = None
+    taunt_turns: Optional[int] = None
+    torment: Optional[bool] = None
+    encore: Optional[Dict[str, Any]] = None
+    disable: Optional[Dict[str, Any]] = None
+    infatuated_with: Optional[int] = None
+    leech_seed: Optional[int] = None
+    partial_trap: Any = None
+    locked_move: Optional[Dict[str, Any]] = None
+    charging_move: Optional[Dict[str, Any]] = None
+    focus_punch_pending: Optional[bool] = None
+    focus_punch_failed: Optional[bool] = None
+    focus_energy: Optional[bool] = None
+    laser_focus: Optional[bool] = None
+    eject_pack_trigger: Optional[bool] = None
+    disguise_busted: Optional[bool] = None
+    aqua_ring: Optional[bool] = None
+    ingrain: Optional[bool] = None
+    magnet_rise: Any = None
+    telekinesis: Any = None
+    power_trick: Optional[bool] = None
+    substitute: Any = None
+    _extra: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> "Volatiles":
+        volatiles = cls()
+        for key, value in values.items():
+            volatiles[key] = value
+        return volatiles
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _VOLATILE_NAMES:
+            value = getattr(self, key)
+        elif self._extra is not None:
+            value = self._extra.get(key)
+        else:
+            value = None
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _VOLATILE_NAMES:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        if key in _VOLATILE_NAMES:
+            value = getattr(self, key)
+            setattr(self, key, None)
+        elif self._extra is not None:
+            value = self._extra.pop(key, None)
+        else:
+            value = None
+        return default if value is None else value
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for key in _VOLATILE_NAMES:
+            value = getattr(self, key)
+            if value is not None:
+                yield key, value
+        if self._extra:
+            yield from self._extra.items()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def copy(self) -> "Volatiles":
+        # Dict-valued volatiles (encore, disable, locked_move, partial_trap,
+        # ...) have their "turns" ticked in place, so each gets its own copy.
+        clone = object.__new__(Volatiles)
+        for name in _VOLATILE_NAMES:
+            value = getattr(self, name)
+            setattr(clone, name, dict(value) if isinstance(value, dict) else value)
+        extra = self._extra
+        clone._extra = None if extra is None else {
+            k: dict(v) if isinstance(v, dict) else v for k, v in extra.items()
+        }
+        return clone
+
+    def __repr__(self) -> str:
+        return f"Volatiles({self.as_dict()!r})"
 
 
-@dataclass
+_VOLATILE_NAMES = frozenset(f.name for f in fields(Volatiles) if f.name != "_extra")
+
+
+@dataclass(slots=True)
 class PokemonState:
     species: str
     level: int
-    base_stats: Dict[str, int]
+    base_stats: Tuple[int, ...]
     types: List[str]
     ability: str
     item: Optional[str] = None
@@ -25,30 +282,61 @@ class PokemonState:
     is_dynamaxed: bool = False
     is_salt_cure: bool = False
     allies_fainted: int = 0
-    ivs: Dict[str, int] = field(
-        default_factory=lambda: {stat: 31 for stat in STAT_NAMES}
-    )
-    evs: Dict[str, int] = field(
-        default_factory=lambda: {stat: 0 for stat in STAT_NAMES}
-    )
+    ivs: List[int] = field(default_factory=_IV_DEFAULT.copy)
+    evs: List[int] = field(default_factory=_EV_DEFAULT.copy)
     current_hp: int = 0
     original_cur_hp: Optional[int] = None
     status: Optional[str] = None
     toxic_counter: int = 0
-    stat_stages: Dict[str, int] = field(
-        default_factory=lambda: {stat: 0 for stat in STAT_NAMES[1:]}
-    )
+    stat_stages: List[int] = field(default_factory=_STAGES_DEFAULT.copy)
     accuracy_stage: int = 0
     evasion_stage: int = 0
-    volatiles: Dict[str, Any] = field(default_factory=dict)
+    volatiles: Volatiles = field(default_factory=Volatiles)
     moves: List["MoveData"] = field(default_factory=list)
     overrides: Dict[str, Any] = field(default_factory=dict)
     weight: float = 100.0
     substitute_hp: Optional[int] = None
     last_move_used: Optional[str] = None
+    # Derived from level/base stats/IVs/nature, which are fixed for the
+    # battle; call recompute_stats() if any of them is changed.
+    max_hp: int = field(init=False, default=0)
+    nature_mult: Tuple[int, ...] = field(init=False, repr=False, default=NEUTRAL_NATURE_MULT)
+    # Per-stat value before stages, indexed by STAT_IDX (slot 0 is max_hp).
+    _unboosted: Tuple[int, ...] = field(init=False, repr=False, compare=False, default=())
+    # is_grounded's type/ability/item verdict, valid while item and ability
+    # are the same objects it was computed from (types never change).
+    _grounded_item: Any = field(init=False, repr=False, compare=False, default=_UNSET)
+    _grounded_ability: Any = field(init=False, repr=False, compare=False, default=_UNSET)
+    _grounded_traits: bool = field(init=False, repr=False, compare=False, default=True)
+    _boosts_view: Optional[StageView] = field(init=False, repr=False, compare=False, default=None)
+    # Last get_effective_speed result and the inputs it was computed from.
+    _speed_key: Tuple[Any, ...] = field(init=False, repr=False, compare=False, default=())
+    _speed: int = field(init=False, repr=False, compare=False, default=0)
 
     def __post_init__(self) -> None:
-        max_hp = self.calc_stat("HP")
+        # base_stats/ivs/evs are indexed by STAT_IDX and stat_stages by
+        # STAGE_IDX; dict input is accepted for convenience.
+        if not isinstance(self.base_stats, tuple):
+            self.base_stats = tuple(_stat_vector(self.base_stats, 0))
+        if not isinstance(self.ivs, list):
+            self.ivs = _stat_vector(self.ivs, 31)
+        if not isinstance(self.evs, list):
+            self.evs = _stat_vector(self.evs, 0)
+        if not isinstance(self.stat_stages, list):
+            self.stat_stages = _stat_vector(self.stat_stages, 0, _NON_HP_STATS)
+        if not isinstance(self.volatiles, Volatiles):
+            self.volatiles = Volatiles.from_dict(self.volatiles)
+        # Interned names let the env's many ability/item/status == "..."
+        # checks against literals succeed on the identity fast path.
+        self.species = sys.intern(self.species)
+        self.ability = sys.intern(self.ability)
+        self.nature = sys.intern(self.nature)
+        if self.item is not None:
+            self.item = sys.intern(self.item)
+        if self.status is not None:
+            self.status = sys.intern(self.status)
+        self.types = [sys.intern(t) for t in self.types]
+        max_hp = self.recompute_stats()
         if self.current_hp <= 0:
             self.current_hp = max_hp
         if self.original_cur_hp is None:
@@ -63,86 +351,90 @@ class PokemonState:
         self.species = value
 
     @property
-    def boosts(self) -> Dict[str, int]:
-        return self.stat_stages
+    def base_stats_dict(self) -> Dict[str, int]:
+        return dict(zip(STAT_NAMES, self.base_stats))
 
     @property
-    def max_hp(self) -> int:
-        return self.calc_stat("HP")
+    def boosts(self) -> StageView:
+        view = self._boosts_view
+        if view is None:
+            view = self._boosts_view = StageView(self)
+        return view
+
+    def recompute_max_hp(self) -> int:
+        base = self.base_stats[0]
+        if base == 1:
+            max_hp = 1
+        else:
+            iv = self.ivs[0]
+            ev = 0  # Run & Bun: EVs are removed
+            lvl = self.level
+            max_hp = ((2 * base + iv + ev // 4) * lvl // 100) + lvl + 10
+        self.max_hp = max_hp
+        return max_hp
+
+    def recompute_stats(self) -> int:
+        max_hp = self.recompute_max_hp()
+        base_stats = self.base_stats
+        ivs = self.ivs
+        level = self.level
+        nature_mult = self.nature_mult = NATURE_MULT.get(self.nature, NEUTRAL_NATURE_MULT)
+        self._speed_key = ()
+        self._unboosted = (max_hp,) + tuple(
+            _unboosted_stat(base_stats[i], ivs[i], level, nature_mult[i])
+            for i in range(1, len(STAT_NAMES))
+        )
+        return max_hp
 
     def calc_stat(self, stat: str) -> int:
-        base = self.base_stats.get(stat, 0)
-        iv = self.ivs.get(stat, 31)
-        ev = 0  # Run & Bun: EVs are removed
-
-        lvl = self.level
-
         if stat == "HP":
-            if base == 1:
-                return 1
-            return ((2 * base + iv + ev // 4) * lvl // 100) + lvl + 10
-
-        raw = ((2 * base + iv + ev // 4) * lvl // 100) + 5
-
-        nature_multipliers: Dict[str, tuple[str, str]] = {
-            # Atk+ natures
-            "Lonely": ("Atk", "Def"),
-            "Brave": ("Atk", "Spe"),
-            "Adamant": ("Atk", "SpA"),
-            "Naughty": ("Atk", "SpD"),
-            # Def+ natures
-            "Bold": ("Def", "Atk"),
-            "Relaxed": ("Def", "Spe"),
-            "Impish": ("Def", "SpA"),
-            "Lax": ("Def", "SpD"),
-            # Spe+ natures
-            "Timid": ("Spe", "Atk"),
-            "Hasty": ("Spe", "Def"),
-            "Jolly": ("Spe", "SpA"),
-            "Naive": ("Spe", "SpD"),
-            # SpA+ natures
-            "Modest": ("SpA", "Atk"),
-            "Mild": ("SpA", "Def"),
-            "Quiet": ("SpA", "Spe"),
-            "Rash": ("SpA", "SpD"),
-            # SpD+ natures
-            "Calm": ("SpD", "Atk"),
-            "Gentle": ("SpD", "Def"),
-            "Sassy": ("SpD", "Spe"),
-            "Careful": ("SpD", "SpA"),
-        }
+            return self.max_hp
 
-        if self.nature in nature_multipliers:
-            inc, dec = nature_multipliers[self.nature]
-            if stat == inc:
-                raw = (raw * 110) // 100
-            elif stat == dec:
-                raw = (raw * 90) // 100
+        idx = STAT_IDX[stat]
 
         # Stat stages + Soul Dew integration
-        stage = self.stat_stages.get(stat, 0)
-        if (
-            self.item == "Soul Dew"
-            and self.species in ("Latias", "Latios")
-            and stat in ("SpA", "SpD")
-        ):
-            stage += 1
-
-        if stage > 6:
-            stage = 6
-        if stage < -6:
-            stage = -6
-
-        if stage > 0:
-            raw = raw * (2 + stage) // 2
-        elif stage < 0:
-            raw = raw * 2 // (2 - stage)
-
-        if self.ability == "Marvel Scale" and self.status is not None and stat == "Def":
-            raw = raw * 3 // 2
-
-        return max(1, raw)
-    
+        stage = self.stat_stages[idx - 1]
+        if stat == "Def":
+            marvel_scale = self.ability == "Marvel Scale" and self.status is not None
+        else:
+            marvel_scale = False
+            if (
+                stat in ("SpA", "SpD")
+                and self.item == "Soul Dew"
+                and self.species in ("Latias", "Latios")
+            ):
+                stage += 1
+
+        return _staged_stat(self._unboosted[idx], stage, marvel_scale)
+
+    def _calc_spe(self) -> int:
+        # calc_stat("Spe") without the name lookup or the Soul Dew / Marvel
+        # Scale checks, neither of which can touch Speed.
+        raw = self._unboosted[5]
+        stage = self.stat_stages[_SPE_STAGE]
+        if stage:
+            if stage > 6:
+                stage = 6
+            elif stage < -6:
+                stage = -6
+            raw = raw * _STAGE_NUM[stage + 6] // _STAGE_DEN[stage + 6]
+        return raw if raw > 1 else 1
+
+    def copy(self) -> "PokemonState":
+        # Rollout copy that skips __init__/__post_init__: per-battle mutable
+        # state is copied, static data (types, moves, ivs/evs) is shared.
+        clone = object.__new__(PokemonState)
+        for name in _POKEMON_FIELD_NAMES:
+            setattr(clone, name, getattr(self, name))
+        clone.stat_stages = self.stat_stages.copy()
+        clone.volatiles = self.volatiles.copy()
+        clone.overrides = self.overrides.copy()
+        clone._boosts_view = None
+        return clone
+
+    def calc_all_stats(self) -> tuple[int, ...]:
+        return tuple(map(self.calc_stat, STAT_NAMES))
+
     def is_grounded(self, field: "FieldState") -> bool:
         if self.current_hp <= 0:
             return False
@@ -150,64 +442,79 @@ class PokemonState:
         if field.is_gravity:
             return True
 
-        if "Flying" in self.types:
-            if self.item == "Iron Ball":
-                pass
-            else:
-                return False
-
-        if self.ability == "Levitate":
-            return False
-
-        if self.volatiles.get("magnet_rise") or self.volatiles.get("telekinesis"):
+        item = self.item
+        ability = self.ability
+        if item is not self._grounded_item or ability is not self._grounded_ability:
+            self._grounded_item = item
+            self._grounded_ability = ability
+            self._grounded_traits = not (
+                ("Flying" in self.types and item != "Iron Ball")
+                or ability == "Levitate"
+                or item == "Air Balloon"
+            )
+        if not self._grounded_traits:
             return False
 
-        if self.item == "Air Balloon":
+        volatiles = self.volatiles
+        if volatiles.magnet_rise or volatiles.telekinesis:
             return False
 
         return True
 
     def get_effective_speed(self, field: "FieldState", side_idx: Optional[int] = None) -> int:
-        base_speed = self.calc_stat("Spe")
-        mult = 1.0
+        tailwind = (
+            side_idx is not None
+            and 0 <= side_idx < len(field.side_flags)
+            and (field.side_flags[side_idx] & SIDE_TAILWIND) != 0
+        )
         w = field.weather
+        ability = self.ability
+        status = self.status
+        key = (self.stat_stages[_SPE_STAGE], w, ability, status, tailwind)
+        if key == self._speed_key:
+            return self._speed
+
+        base_speed = self._calc_spe()
+        mult = 1.0
 
-        if w == "Rain" and self.ability == "Swift Swim":
+        if w == "Rain" and ability == "Swift Swim":
             mult *= 2.0
-        if w == "Sun" and self.ability == "Chlorophyll":
+        if w == "Sun" and ability == "Chlorophyll":
             mult *= 2.0
-        if w == "Sandstorm" and self.ability == "Sand Rush":
+        if w == "Sandstorm" and ability == "Sand Rush":
             mult *= 2.0
-        if w in ("Hail", "Snow") and self.ability == "Slush Rush":
+        if w in ("Hail", "Snow") and ability == "Slush Rush":
             mult *= 2.0
 
-        if self.status == "par":
-            if self.ability != "Quick Feet":
+        if status == "par":
+            if ability != "Quick Feet":
                 mult *= 0.25
-        if self.ability == "Quick Feet" and self.status is not None:
+        if ability == "Quick Feet" and status is not None:
             mult *= 1.5
 
-        if side_idx is not None and 0 <= side_idx < len(field.tailwind):
-            if field.tailwind[side_idx]:
-                mult *= 2.0
+        if tailwind:
+            mult *= 2.0
 
-        return max(1, int(base_speed * mult))
+        speed = max(1, int(base_speed * mult))
+        self._speed_key = key
+        self._speed = speed
+        return speed
 
-    def apply_status(self, status: str) -> bool:
-        status = status.lower()
+    def apply_status(self, status: str, rng: Optional[random.Random] = None) -> bool:
         if self.status is not None:
             return False
+        status = sys.intern(status.lower())
 
         if status == "slp":
-            self.volatiles["sleep_turns"] = random.randint(1, 3)
+            self.volatiles.sleep_turns = (random if rng is None else rng).randint(1, 3)
         elif status == "tox":
             self.toxic_counter = 1
         elif status == "psn":
             self.toxic_counter = 0
         elif status == "frz":
-            self.volatiles["frozen"] = True
+            self.volatiles.frozen = True
         else:
-            self.volatiles.pop("sleep_turns", None)
+            self.volatiles.sleep_turns = None
 
         self.status = status
         if self.item == "Lum Berry":
@@ -218,9 +525,9 @@ class PokemonState:
     def cure_status(self) -> None:
         current = self.status
         if current == "slp":
-            self.volatiles.pop("sleep_turns", None)
+            self.volatiles.sleep_turns = None
         elif current == "frz":
-            self.volatiles.pop("frozen", None)
+            self.volatiles.frozen = None
         if current == "tox":
             self.toxic_counter = 0
         elif current == "psn":
@@ -228,33 +535,39 @@ class PokemonState:
         self.status = None
 
     def get_stage_value(self, stat: str) -> int:
-        key = stat.lower()
-        if key in ("acc", "accuracy"):
-            return self.accuracy_stage
-        if key in ("eva", "evasion"):
-            return self.evasion_stage
-        normalized = stat
-        if normalized not in self.stat_stages:
-            normalized = stat.capitalize()
-        return self.stat_stages.get(normalized, 0)
+        idx = STAGE_IDX.get(stat)
+        if idx is None:
+            stat = _canonical_stage_stat(stat)
+            if stat == "accuracy":
+                return self.accuracy_stage
+            if stat == "evasion":
+                return self.evasion_stage
+            idx = STAGE_IDX.get(stat)
+            if idx is None:
+                return 0
+        return self.stat_stages[idx]
 
     def set_stage_value(self, stat: str, value: int) -> None:
         clamped = max(-6, min(6, value))
-        key = stat.lower()
-        if key in ("acc", "accuracy"):
-            self.accuracy_stage = clamped
-        elif key in ("eva", "evasion"):
-            self.evasion_stage = clamped
-        else:
-            normalized = stat
-            if normalized not in self.stat_stages:
-                normalized = stat.capitalize()
-            self.stat_stages[normalized] = clamped
+        idx = STAGE_IDX.get(stat)
+        if idx is None:
+            stat = _canonical_stage_stat(stat)
+            if stat == "accuracy":
+                self.accuracy_stage = clamped
+                return
+            if stat == "evasion":
+                self.evasion_stage = clamped
+                return
+            idx = STAGE_IDX.get(stat)
+            if idx is None:
+                return
+        self.stat_stages[idx] = clamped
 
     def clear_negative_stages(self) -> None:
-        for stat in list(self.stat_stages.keys()):
-            if self.stat_stages[stat] < 0:
-                self.stat_stages[stat] = 0
+        stages = self.stat_stages
+        for idx, value in enumerate(stages):
+            if value < 0:
+                stages[idx] = 0
         if self.accuracy_stage < 0:
             self.accuracy_stage = 0
         if self.evasion_stage < 0:
@@ -262,7 +575,7 @@ class PokemonState:
 
     def _handle_stat_drop_reactions(self, from_opponent: bool) -> None:
         if from_opponent and self.item == "Eject Pack":
-            self.volatiles["eject_pack_trigger"] = True
+            self.volatiles.eject_pack_trigger = True
         if self.item == "White Herb":
             self.clear_negative_stages()
             self.item = None
@@ -288,30 +601,31 @@ class PokemonState:
         if stages == 0:
             return 0
 
+        stat = _canonical_stage_stat(stat)
+        ability = self.ability
         delta = stages
-        if allow_simple and self.ability == "Simple":
+        if allow_simple and ability == "Simple":
             delta *= 2
-        if allow_contrary and self.ability == "Contrary":
+        if allow_contrary and ability == "Contrary":
             delta *= -1
 
         opponent_effect = from_opponent or (source is not None and source is not self)
-        lowered = False
 
         if delta < 0:
-            if intimidate and self.ability in {"Own Tempo", "Oblivious", "Scrappy", "Inner Focus"}:
+            if intimidate and ability in _INTIMIDATE_IMMUNE:
                 return 0
             if not ignore_blockers and opponent_effect:
-                if self.ability in {"Clear Body", "White Smoke", "Full Metal Body"}:
+                if ability in _STAT_DROP_BLOCKERS:
                     return 0
-                if self.ability == "Hyper Cutter" and stat.lower() in ("atk", "attack"):
+                if ability == "Hyper Cutter" and stat == "Atk":
                     return 0
-                if self.ability == "Keen Eye" and stat.lower() in ("accuracy", "acc"):
+                if ability == "Keen Eye" and stat == "accuracy":
                     return 0
                 if self.item == "Clear Amulet":
                     return 0
             if (
                 opponent_effect
-                and self.ability == "Mirror Armor"
+                and ability == "Mirror Armor"
                 and source is not None
                 and source is not self
                 and not via_mirror_armor
@@ -336,16 +650,14 @@ class PokemonState:
 
         self.set_stage_value(stat, new_stage)
 
-        if new_stage < current:
-            lowered = True
-
-        if lowered:
+        # new_stage != current here, so the clamp cannot flip the direction.
+        if delta < 0:
             self._handle_stat_drop_reactions(opponent_effect)
 
         return new_stage - current
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldSideState:
     spikes: int = 0
     steelsurge: bool = False
@@ -369,7 +681,34 @@ class FieldSideState:
     is_switching: Optional[Literal["out", "in"]] = None
 
 
-@dataclass
+_POKEMON_FIELD_NAMES = tuple(f.name for f in fields(PokemonState))
+
+
+# FieldState.side_flags bits, one int per side.
+SIDE_STEALTH_ROCK = 1 << 0
+SIDE_REFLECT = 1 << 1
+SIDE_LIGHT_SCREEN = 1 << 2
+SIDE_AURORA_VEIL = 1 << 3
+SIDE_STICKY_WEB = 1 << 4
+SIDE_STEELSURGE = 1 << 5
+SIDE_TAILWIND = 1 << 6
+
+SCREEN_MASK = SIDE_REFLECT | SIDE_LIGHT_SCREEN | SIDE_AURORA_VEIL
+HAZARD_FLAG_MASK = SIDE_STEALTH_ROCK | SIDE_STICKY_WEB | SIDE_STEELSURGE
+
+# Slots of FieldState.side_counters[side_idx]; each holds turns remaining.
+COUNTER_TAILWIND = 0
+COUNTER_REFLECT = 1
+COUNTER_LIGHT_SCREEN = 2
+COUNTER_AURORA_VEIL = 3
+COUNTER_GMAX_VINELASH = 4
+COUNTER_GMAX_WILDFIRE = 5
+COUNTER_GMAX_CANNONADE = 6
+COUNTER_GMAX_VOLCALITH = 7
+NUM_SIDE_COUNTERS = 8
+
+
+@dataclass(slots=True)
 class FieldState:
     game_type: str = "Singles"
     weather: Optional[str] = None
@@ -389,22 +728,11 @@ class FieldState:
     attacker_side: FieldSideState = field(default_factory=FieldSideState)
     defender_side: FieldSideState = field(default_factory=FieldSideState)
     spikes: List[int] = field(default_factory=lambda: [0, 0])
-    stealth_rocks: List[bool] = field(default_factory=lambda: [False, False])
     toxic_spikes: List[int] = field(default_factory=lambda: [0, 0])
-    sticky_web: List[bool] = field(default_factory=lambda: [False, False])
-    steelsurge: List[bool] = field(default_factory=lambda: [False, False])
-    tailwind: List[bool] = field(default_factory=lambda: [False, False])
-    reflect: List[bool] = field(default_factory=lambda: [False, False])
-    light_screen: List[bool] = field(default_factory=lambda: [False, False])
-    aurora_veil: List[bool] = field(default_factory=lambda: [False, False])
-    tailwind_turns: List[int] = field(default_factory=lambda: [0, 0])
-    reflect_turns: List[int] = field(default_factory=lambda: [0, 0])
-    light_screen_turns: List[int] = field(default_factory=lambda: [0, 0])
-    aurora_veil_turns: List[int] = field(default_factory=lambda: [0, 0])
-    gmax_vinelash_turns: List[int] = field(default_factory=lambda: [0, 0])
-    gmax_wildfire_turns: List[int] = field(default_factory=lambda: [0, 0])
-    gmax_cannonade_turns: List[int] = field(default_factory=lambda: [0, 0])
-    gmax_volcalith_turns: List[int] = field(default_factory=lambda: [0, 0])
+    side_flags: List[int] = field(default_factory=lambda: [0, 0])
+    side_counters: List[List[int]] = field(
+        default_factory=lambda: [[0] * NUM_SIDE_COUNTERS, [0] * NUM_SIDE_COUNTERS]
+    )
 
     def has_weather(self, *weathers: str) -> bool:
         return bool(self.weather and self.weather in weathers)
@@ -412,19 +740,69 @@ class FieldState:
     def has_terrain(self, *terrains: str) -> bool:
         return bool(self.terrain and self.terrain in terrains)
 
+    def has_side_flag(self, side_idx: int, flag: int) -> bool:
+        return (self.side_flags[side_idx] & flag) != 0
+
+    def set_side_flag(self, side_idx: int, flag: int) -> None:
+        self.side_flags[side_idx] |= flag
+
+    def clear_side_flag(self, side_idx: int, flag: int) -> None:
+        self.side_flags[side_idx] &= ~flag
 
-@dataclass
+    def has_screen(self, side_idx: int) -> bool:
+        return (self.side_flags[side_idx] & SCREEN_MASK) != 0
+
+    def side_counter(self, side_idx: int, counter: int) -> int:
+        return self.side_counters[side_idx][counter]
+
+    def set_side_counter(self, side_idx: int, counter: int, turns: int) -> None:
+        self.side_counters[side_idx][counter] = turns
+
+
+@dataclass(slots=True)
 class SideState:
     active: List[PokemonState]
     party: List[PokemonState]
     is_player: bool = False
+    # Index of active[0] within party; active is kept in sync by switch_to.
+    active_idx: int = 0
 
-
-@dataclass
+    def __post_init__(self) -> None:
+        if self.active:
+            for idx, mon in enumerate(self.party):
+                if mon is self.active[0]:
+                    self.active_idx = idx
+                    break
+
+    def switch_to(self, idx: int) -> PokemonState:
+        self.active_idx = idx
+        mon = self.party[idx]
+        self.active[0] = mon
+        return mon
+
+    def bench_indices(self) -> List[int]:
+        active_idx = self.active_idx
+        return [
+            idx
+            for idx, mon in enumerate(self.party)
+            if idx != active_idx and mon.current_hp > 0
+        ]
+
+
+@dataclass(slots=True)
 class BattleState:
     sides: List[SideState]
     field: FieldState
     turn: int = 1
+    # Source of every battle roll (accuracy, crits, damage, status and effect
+    # chances). A seeded random.Random makes a rollout reproducible on its
+    # own; None shares the module-level generator.
+    rng: Optional[random.Random] = None
+    # Pre-drawn uniforms for move-effect chance rolls (refilled from rng by
+    # move_effects); per battle, so separate battles and threads never
+    # consume each other's rolls.
+    roll_buffer: List[float] = field(default_factory=list)
+    roll_pos: int = 0
 
     def get_opponent(self, side_idx: int) -> SideState:
         return self.sides[1 - side_idx]
@@ -1,10 +1,13 @@
 # test_battle.py
 
+import copy
+import pickle
 import random
 
-from state import PokemonState, FieldState, SideState, BattleState
+from state import PokemonState, FieldState, SideState, BattleState, SIDE_REFLECT, COUNTER_REFLECT
 from data_loader import MoveData
-from env import BattleEnv
+from env import BattleEnv, compute_damage_for_hit
+from move_effects import _roll_percent
 import ai_policy
 from damage import TYPE_CHART
 
@@ -153,12 +156,149 @@ def test_pinch_berry_heal() -> None:
     assert berrymon.item is None
 
 
+def test_moody_only_raises_unmaxed_stat() -> None:
+    stats = {"HP": 100, "Atk": 80, "Def": 80, "SpA": 80, "SpD": 80, "Spe": 80}
+    moody = PokemonState("Moody", 50, stats, ["Normal"], "Moody")
+    foe = PokemonState("Foe", 50, stats, ["Normal"], "Blaze")
+    moody.moves = [SPLASH_MOVE]
+    foe.moves = [SPLASH_MOVE]
+    env = build_env(moody, foe)
+    for stat in ("Atk", "Def", "SpA", "SpD", "Acc", "Eva"):
+        moody.set_stage_value(stat, 6)
+
+    random.seed(0)
+    env._apply_moody_boosts()
+    assert moody.get_stage_value("Spe") == 2
+    lowered = [s for s in ("Atk", "Def", "SpA", "SpD", "Acc", "Eva") if moody.get_stage_value(s) == 5]
+    assert len(lowered) == 1
+
+
+def test_side_condition_and_weather_effects() -> None:
+    stats = {"HP": 100, "Atk": 80, "Def": 80, "SpA": 80, "SpD": 80, "Spe": 80}
+    setter = PokemonState("Setter", 50, stats, ["Psychic"], "Synchronize", item="Light Clay")
+    foe = PokemonState("Foe", 50, stats, ["Normal"], "Blaze")
+    reflect = make_status_move("Reflect", "Psychic")
+    rain_dance = make_status_move("Rain Dance", "Water")
+    setter.moves = [reflect, rain_dance]
+    foe.moves = [SPLASH_MOVE]
+    env = build_env(setter, foe)
+
+    random.seed(0)
+    env.apply_turn(reflect)
+    field = env.state.field
+    assert field.has_side_flag(0, SIDE_REFLECT) and not field.has_side_flag(1, SIDE_REFLECT)
+    assert field.side_counter(0, COUNTER_REFLECT) == 7, "Light Clay extends Reflect to 8 turns"
+
+    env.apply_turn(rain_dance)
+    assert field.weather == "Rain"
+    assert field.weather_turns == 4
+
+
+def test_roar_drags_in_bench_mon() -> None:
+    stats = {"HP": 100, "Atk": 80, "Def": 80, "SpA": 80, "SpD": 80, "Spe": 80}
+    roarer = PokemonState("Roarer", 50, stats, ["Normal"], "Synchronize")
+    foe = PokemonState("Foe", 50, stats, ["Normal"], "Blaze")
+    benched = PokemonState("Benched", 50, stats, ["Normal"], "Blaze")
+    roar = make_status_move("Roar")
+    roarer.moves = [roar]
+    foe.moves = [SPLASH_MOVE]
+    benched.moves = [SPLASH_MOVE]
+    env = build_env(roarer, foe, opponent_bench=[benched])
+
+    random.seed(0)
+    env.apply_turn(roar)
+    side = env.state.sides[1]
+    assert side.active[0] is benched
+    assert side.active_idx == 1
+
+
+def test_dragon_tail_into_eject_button_switches_once() -> None:
+    stats = {"HP": 200, "Atk": 60, "Def": 100, "SpA": 60, "SpD": 100, "Spe": 80}
+    dragon_tail = MoveData("Dragon Tail", "Dragon", "Physical", 60, 100, 10)
+    user = PokemonState("User", 50, stats, ["Dragon"], "Synchronize")
+    holder = PokemonState("Holder", 50, stats, ["Normal"], "Blaze", item="Eject Button")
+    first = PokemonState("First", 50, stats, ["Normal"], "Blaze")
+    second = PokemonState("Second", 50, stats, ["Normal"], "Blaze")
+    user.moves = [dragon_tail]
+    for mon in (holder, first, second):
+        mon.moves = [SPLASH_MOVE]
+    env = build_env(user, holder, opponent_bench=[first, second])
+    side = env.state.sides[1]
+
+    random.seed(0)
+    env.apply_turn(dragon_tail)
+    assert holder.item is None
+    assert side.active[0] is first, "Eject Button's switch should not be phazed again"
+
+    env.apply_turn(dragon_tail)
+    assert side.active[0] is not first, "Dragon Tail should drag out the Eject Button replacement"
+
+
+def test_battle_state_copies_with_seeded_rng() -> None:
+    env, flamethrower, _ = make_test_battle()
+    env.state.rng = random.Random(5)
+    clone = copy.deepcopy(env.state)
+    assert pickle.loads(pickle.dumps(clone)).rng.getstate() == clone.rng.getstate()
+
+    def roll(state):
+        attacker, defender = state.sides[0].active[0], state.sides[1].active[0]
+        return [
+            compute_damage_for_hit(attacker, defender, flamethrower, state.field, 0, False, rng=state.rng)
+            for _ in range(8)
+        ]
+
+    assert roll(env.state) == roll(clone)
+
+
+def test_effect_rolls_are_per_battle() -> None:
+    env, _, _ = make_test_battle()
+    env.state.rng = random.Random(3)
+    twin = copy.deepcopy(env.state)
+    rolls = [_roll_percent(env.state) for _ in range(5)]
+    make_test_battle()  # starting another battle must not disturb this one
+    rolls += [_roll_percent(env.state) for _ in range(5)]
+    assert rolls == [_roll_percent(twin) for _ in range(10)]
+
+
+def test_copied_mon_ticks_independently() -> None:
+    stats = {"HP": 80, "Atk": 80, "Def": 80, "SpA": 80, "SpD": 80, "Spe": 80}
+    mon = PokemonState("Original", 50, stats, ["Normal"], "Blaze")
+    mon.volatiles.encore = {"move": "Splash", "turns": 3}
+    mon.volatiles.partial_trap = {"turns": 4, "source": 1}
+
+    clone = mon.copy()
+    clone.volatiles.encore["turns"] -= 1
+    clone.volatiles.partial_trap["turns"] -= 1
+    assert mon.volatiles.encore["turns"] == 3
+    assert mon.volatiles.partial_trap["turns"] == 4
+
+
+def test_recompute_stats_after_level_change() -> None:
+    stats = {"HP": 80, "Atk": 80, "Def": 80, "SpA": 80, "SpD": 80, "Spe": 100}
+    mon = PokemonState("Grower", 50, stats, ["Normal"], "Blaze")
+    field = FieldState()
+    assert mon.get_effective_speed(field, 0) == mon.calc_stat("Spe")
+
+    mon.level = 100
+    mon.nature = "Timid"
+    mon.recompute_stats()
+    assert mon.get_effective_speed(field, 0) == mon.calc_stat("Spe") == 259
+
+
 def run_all_tests() -> None:
     test_basic_battle()
     test_intimidate_eject_pack()
     test_white_herb_screech()
     test_baton_pass_transfers_boosts()
     test_pinch_berry_heal()
+    test_moody_only_raises_unmaxed_stat()
+    test_side_condition_and_weather_effects()
+    test_roar_drags_in_bench_mon()
+    test_dragon_tail_into_eject_button_switches_once()
+    test_battle_state_copies_with_seeded_rng()
+    test_effect_rolls_are_per_battle()
+    test_copied_mon_ticks_independently()
+    test_recompute_stats_after_level_change()
     print("All battle tests passed.")
 
 
@@ -1,14 +1,36 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Literal
+from typing import DefaultDict, List, Dict, Optional, Literal
+import sys
 
+import numpy as np
 import pandas as pd
 
+from trainer_parsing import (
+    _NONE_TOKENS,
+    _first_row,
+    _index_labels,
+    _is_missing,
+    _read_trainer_sheets,
+)
+
 BattleFormat = Literal["single", "double", "multi", "unknown"]
 
 
-@dataclass
+def _clean_str(v: object) -> Optional[str]:
+    # Interned, stripped text of a string cell; None for non-string cells,
+    # blanks and placeholder tokens.
+    if not isinstance(v, str):
+        return None
+    s = v.strip()
+    if not s or s.lower() in _NONE_TOKENS:
+        return None
+    return sys.intern(s)
+
+
+@dataclass(slots=True)
 class TrainerPokemon:
     species: str
     level: int
@@ -18,7 +40,7 @@ class TrainerPokemon:
     moves: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Trainer:
     id: str
     name: str
@@ -34,96 +56,67 @@ def _parse_trainer_block(
     start_row: int,
     end_row: int,
     pre_block_name: Optional[str] = None,
+    sheet_arr: Optional[np.ndarray] = None,
+    label_rows: Optional[Dict[str, List[int]]] = None,
 ) -> Optional[Trainer]:
-    key_col = df.columns[0]
-    sub = df.iloc[start_row:end_row].copy().reset_index(drop=True)
-    labels = sub[key_col]
+    # Same sheet_arr/label_rows contract as trainer_parsing._parse_trainer_block.
+    if sheet_arr is None:
+        sheet_arr = df.to_numpy(dtype=object, copy=False)
+    if label_rows is None:
+        label_rows = _index_labels(sheet_arr[:, 0])
+    arr = sheet_arr[start_row:end_row]
+    labels = arr[:, 0]
 
     if pre_block_name is not None:
         name = pre_block_name
     else:
-        first_label = labels.iloc[0]
+        first_label = labels[0]
         if str(first_label) != "Name":
             return None
-        name_cell = sub.iloc[0, 1]
-        if pd.isna(name_cell):
+        name_cell = arr[0, 1]
+        if name_cell == "" or _is_missing(name_cell):
             return None
         name = str(name_cell).strip()
 
-    pok_rows = labels[labels == "Pokémon"].index.tolist()
-    if not pok_rows:
+    pok_idx = _first_row(label_rows, "Pokémon", start_row, end_row)
+    if pok_idx is None:
         return None
-    pok_idx = pok_rows[0]
-    if pok_idx + 1 >= len(sub):
+    if pok_idx + 1 >= len(arr):
         return None
-    species_row = sub.iloc[pok_idx + 1]
 
-    def find_row(label: str) -> Optional[int]:
-        idxs = labels[labels == label].index.tolist()
-        return idxs[0] if idxs else None
-
-    level_idx = find_row("Level")
-    item_idx = find_row("Held Item")
-    ability_idx = find_row("Ability")
-    nature_idx = find_row("Nature")
-    moves_start_idx = find_row("Moves")
+    level_idx = _first_row(label_rows, "Level", start_row, end_row)
+    item_idx = _first_row(label_rows, "Held Item", start_row, end_row)
+    ability_idx = _first_row(label_rows, "Ability", start_row, end_row)
+    nature_idx = _first_row(label_rows, "Nature", start_row, end_row)
+    moves_start_idx = _first_row(label_rows, "Moves", start_row, end_row)
 
     if None in (level_idx, item_idx, ability_idx, nature_idx, moves_start_idx):
         return None
 
-    moves_rows = sub.iloc[moves_start_idx:]
-    team_cols: List[str] = []
-    for col in df.columns[1:]:
-        val = species_row.get(col)
-        if isinstance(val, str) and val.strip():
-            team_cols.append(col)
+    moves_np = arr[moves_start_idx:]
+    species_cells = arr[pok_idx + 1]
+
+    team_cols = [
+        j
+        for j in range(1, len(species_cells))
+        if isinstance(species_cells[j], str) and species_cells[j].strip()
+    ]
 
     team: List[TrainerPokemon] = []
-    for col in team_cols:
-        species = str(species_row[col]).strip()
+    for j in team_cols:
+        species = sys.intern(str(species_cells[j]).strip())
 
-        raw_level = sub.iloc[level_idx][col]
-        if pd.isna(raw_level):
+        raw_level = arr[level_idx, j]
+        if raw_level == "" or _is_missing(raw_level):
             continue
-        level = int(str(raw_level).strip())
-
-        raw_item = sub.iloc[item_idx].get(col)
-        item: Optional[str] = None
-        if isinstance(raw_item, str):
-            s = raw_item.strip()
-            if s and s.lower() not in ("none", "nan"):
-                item = s
-
-        raw_ability = sub.iloc[ability_idx].get(col)
-        ability: Optional[str] = None
-        if isinstance(raw_ability, str):
-            s = raw_ability.strip()
-            if s and s.lower() not in ("none", "nan"):
-                ability = s
-
-        raw_nature = sub.iloc[nature_idx].get(col)
-        nature: Optional[str] = None
-        if isinstance(raw_nature, str):
-            s = raw_nature.strip()
-            if s and s.lower() not in ("none", "nan"):
-                nature = s
-
-        moves: List[str] = []
-        for _, row in moves_rows.iterrows():
-            mv = row.get(col)
-            if isinstance(mv, str):
-                m = mv.strip()
-                if m and m.lower() not in ("none", "nan"):
-                    moves.append(m)
-
         team.append(
             TrainerPokemon(
                 species=species,
-                level=level,
-                item=item,
-                ability=ability,
-                nature=nature,
-                moves=moves,
+                level=int(str(raw_level).strip()),
+                item=_clean_str(arr[item_idx, j]),
+                ability=_clean_str(arr[ability_idx, j]),
+                nature=_clean_str(arr[nature_idx, j]),
+                moves=[m for m in map(_clean_str, moves_np[:, j]) if m],
             )
         )
 
@@ -135,10 +128,13 @@ def _parse_trainer_block(
 
     clean_name = name.replace("[Double]", "").strip()
 
+    # Names repeat across thousands of team slots; interning makes the
+    # duplicates share one string object.
+    sheet_name = sys.intern(sheet_name)
     if sheet_name == "Pokémon League":
         location = sheet_name
     else:
-        location = str(df.columns[1])
+        location = sys.intern(str(df.columns[1]))
 
     trainer_id = f"{clean_name}@{location}@{fmt}"
 
@@ -153,27 +149,42 @@ def _parse_trainer_block(
 
 
 def parse_trainer_sheet(df: pd.DataFrame, sheet_name: str) -> List[Trainer]:
-    key_col = df.columns[0]
     trainers: List[Trainer] = []
     n_rows = len(df)
 
     if n_rows == 0:
         return trainers
 
-    name_rows = df.index[df[key_col] == "Name"].tolist()
-    first_label = df.iloc[0][key_col]
+    sheet_arr = df.to_numpy(dtype=object, copy=False)
+    label_rows = _index_labels(sheet_arr[:, 0])
+    name_rows = label_rows.get("Name", [])
+    first_label = sheet_arr[0, 0]
 
     if isinstance(first_label, str) and first_label == "Pokémon":
         pre_end = name_rows[0] if name_rows else n_rows
         pre_name = str(df.columns[1])
-        t = _parse_trainer_block(df, sheet_name, 0, pre_end, pre_block_name=pre_name)
+        t = _parse_trainer_block(
+            df,
+            sheet_name,
+            0,
+            pre_end,
+            pre_block_name=pre_name,
+            sheet_arr=sheet_arr,
+            label_rows=label_rows,
+        )
         if t is not None:
             trainers.append(t)
 
-    name_rows = df.index[df[key_col] == "Name"].tolist()
     for i, start_row in enumerate(name_rows):
         end_row = name_rows[i + 1] if i + 1 < len(name_rows) else n_rows
-        t = _parse_trainer_block(df, sheet_name, start_row, end_row)
+        t = _parse_trainer_block(
+            df,
+            sheet_name,
+            start_row,
+            end_row,
+            sheet_arr=sheet_arr,
+            label_rows=label_rows,
+        )
         if t is not None:
             trainers.append(t)
 
@@ -182,19 +193,19 @@ def parse_trainer_sheet(df: pd.DataFrame, sheet_name: str) -> List[Trainer]:
 
 class TrainerDex:
     def __init__(self, trainers: List[Trainer]):
-        self.trainers_by_id: Dict[str, Trainer] = {t.id: t for t in trainers}
-        self.trainers_by_name: Dict[str, List[Trainer]] = {}
+        by_id: Dict[str, Trainer] = {}
+        by_name: DefaultDict[str, List[Trainer]] = defaultdict(list)
         for t in trainers:
-            self.trainers_by_name.setdefault(t.name, []).append(t)
+            by_id[t.id] = t
+            by_name[t.name].append(t)
+        self.trainers_by_id: Dict[str, Trainer] = by_id
+        # Plain dict so lookups of unknown names don't insert empty lists.
+        self.trainers_by_name: Dict[str, List[Trainer]] = dict(by_name)
 
     @classmethod
     def from_workbook(cls, path: str) -> "TrainerDex":
-        xls = pd.ExcelFile(path)
         trainers: List[Trainer] = []
-        for sheet in xls.sheet_names:
-            if sheet in ("Dex", "Sprites"):
-                continue
-            df = xls.parse(sheet)
+        for sheet, df in _read_trainer_sheets(path).items():
             trainers.extend(parse_trainer_sheet(df, sheet))
         return cls(trainers)
 
@@ -1,20 +1,85 @@
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Literal
+from functools import lru_cache
+from typing import DefaultDict, Dict, List, Optional, Sequence, Tuple, Literal
 import json
 import re
+import sys
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib json module
+    orjson = None
+
 STAT_NAMES = ("HP", "Atk", "Def", "SpA", "SpD", "Spe")
+# Shared by every TrainerPokemon without an IV override, so
+# TrainerPokemon.ivs must be treated as read-only (copy before editing).
+_DEFAULT_IVS: Dict[str, int] = {stat: 31 for stat in STAT_NAMES}
 BattleFormat = Literal["single", "double", "multi", "unknown"]
 
+_BRACKET_RE = re.compile(r"\s*\[.*?\]\s*")
+# Placeholder cell text that means "no value" (compared lowercased).
+_NONE_TOKENS = frozenset(("none", "nan"))
+
+
+def _is_missing(v: object) -> bool:
+    # Scalar stand-in for pd.isna: sheet cells are only ever str, numbers,
+    # None or float NaN (the one value that is not equal to itself).
+    return v is None or (isinstance(v, float) and v != v)
+
+
+def _clean_opt(v: object) -> Optional[str]:
+    if type(v) is str:
+        s = v.strip()
+    elif _is_missing(v):
+        return None
+    else:
+        s = str(v).strip()
+    if not s or s.lower() in _NONE_TOKENS:
+        return None
+    return sys.intern(s)
+
+
+def _intern_opt(s: Optional[str]) -> Optional[str]:
+    return None if s is None else sys.intern(s)
+
+
+def _index_labels(labels: Sequence[object]) -> Dict[str, List[int]]:
+    # label -> ascending row positions, built in one pass over a sheet's
+    # first column and shared by every block parsed from that sheet.
+    rows_by_label: Dict[str, List[int]] = {}
+    for i, v in enumerate(labels):
+        if isinstance(v, str):
+            rows_by_label.setdefault(v, []).append(i)
+    return rows_by_label
 
+
+def _first_row(
+    label_rows: Dict[str, List[int]], label: str, start_row: int, end_row: int
+) -> Optional[int]:
+    # Position of `label`'s first row inside [start_row, end_row), relative
+    # to start_row.
+    rows = label_rows.get(label)
+    if not rows:
+        return None
+    k = bisect_left(rows, start_row)
+    if k < len(rows) and rows[k] < end_row:
+        return rows[k] - start_row
+    return None
+
+
+@lru_cache(maxsize=4096)
 def canonical_trainer_name(raw: str) -> str:
     if raw is None:
         return ""
-    s = re.sub(r"\s*\[.*?\]\s*", " ", str(raw))
+    s = _BRACKET_RE.sub(" ", str(raw))
     return " ".join(s.split())
 
 
@@ -40,66 +105,38 @@ def load_iv_overrides_from_setdex_js(
     }
     overrides: Dict[Tuple[str, str], Dict[str, int]] = {}
 
-    text = open(path, "r", encoding="utf-8").read()
-
-    pattern = re.compile(r'"(?P<species>[^"]+)":\{"(?P<trainer>[^"]+)":\{', re.DOTALL)
-
-    for m in pattern.finditer(text):
-        species = m.group("species")
-        trainer_raw = m.group("trainer")
-        trainer = canonical_trainer_name(trainer_raw)
-
-        body_start = m.end() - 1
-        depth = 0
-        i = body_start
-        while i < len(text):
-            ch = text[i]
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-                if depth == 0:
-                    break
-            i += 1
-        if depth != 0:
-            continue
-        body = text[body_start : i + 1]
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
 
-        m_ivs = re.search(r'"ivs"\s*:\s*\{([^}]*)\}', body)
-        if not m_ivs:
-            continue
-        ivs_body = m_ivs.group(1)
+    # The setdex is a single `var SETDEX_X = {...};` object literal in JSON
+    # syntax, so strip the JS wrapper and parse it in one go.
+    first = text.find("{")
+    last = text.rfind("}")
+    if first == -1 or last < first:
+        return overrides
+    data = json.loads(text[first : last + 1])
 
-        raw_pairs: Dict[str, int] = {}
-        for chunk in ivs_body.split(","):
-            chunk = chunk.strip()
-            if not chunk or ":" not in chunk:
-                continue
-            key, val = chunk.split(":", 1)
-            key = key.strip().strip('"')
-            val = val.strip()
-            if not val:
+    for species, trainers in data.items():
+        if not isinstance(trainers, dict):
+            continue
+        for trainer_raw, mon in trainers.items():
+            if not isinstance(mon, dict):
                 continue
-            try:
-                raw_pairs[key] = int(val)
-            except ValueError:
+            ivs = mon.get("ivs")
+            if not ivs:
                 continue
-
-        if not raw_pairs:
-            continue
-
-        ivs_full: Dict[str, int] = {}
-        for short, full in short_to_full.items():
-            if short in raw_pairs:
-                ivs_full[full] = raw_pairs[short]
-
-        if ivs_full:
-            overrides[(trainer, species)] = ivs_full
+            ivs_full = {
+                short_to_full[key]: int(val)
+                for key, val in ivs.items()
+                if key in short_to_full
+            }
+            if ivs_full:
+                overrides[(canonical_trainer_name(trainer_raw), species)] = ivs_full
 
     return overrides
 
 
-@dataclass
+@dataclass(slots=True)
 class TrainerPokemon:
     species: str
     level: int
@@ -110,7 +147,7 @@ class TrainerPokemon:
     ivs: Dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class Trainer:
     id: str
     name: str
@@ -128,104 +165,80 @@ def _parse_trainer_block(
     end_row: int,
     iv_overrides: Dict[Tuple[str, str], Dict[str, int]],
     pre_block_name: Optional[str] = None,
+    sheet_arr: Optional[np.ndarray] = None,
+    label_rows: Optional[Dict[str, List[int]]] = None,
 ) -> Optional[Trainer]:
-    key_col = df.columns[0]
-    sub = df.iloc[start_row:end_row].copy().reset_index(drop=True)
-    labels = sub[key_col]
+    # parse_trainer_sheet passes the whole sheet as one object array plus
+    # its label index; the block is a row-slice view of that array and cell
+    # reads below index it by (row, column position).
+    if sheet_arr is None:
+        sheet_arr = df.to_numpy(dtype=object, copy=False)
+    if label_rows is None:
+        label_rows = _index_labels(sheet_arr[:, 0])
+    arr = sheet_arr[start_row:end_row]
+    labels = arr[:, 0]
 
     if pre_block_name is not None:
         raw_name = str(pre_block_name).strip()
     else:
-        first_label = labels.iloc[0]
+        first_label = labels[0]
         if str(first_label) != "Name":
             return None
-        raw_name_cell = sub.iloc[0, 1]
-        if pd.isna(raw_name_cell):
+        raw_name_cell = arr[0, 1]
+        if raw_name_cell == "" or _is_missing(raw_name_cell):
             return None
         raw_name = str(raw_name_cell).strip()
 
-    pokemon_rows = labels[labels == "Pokémon"].index.tolist()
-    if not pokemon_rows:
+    pok_idx = _first_row(label_rows, "Pokémon", start_row, end_row)
+    if pok_idx is None:
         return None
-    pok_idx = pokemon_rows[0]
-    if pok_idx + 1 >= len(sub):
+    if pok_idx + 1 >= len(arr):
         return None
-    species_row = sub.iloc[pok_idx + 1]
-
-    def find_row(label: str) -> Optional[int]:
-        idxs = labels[labels == label].index.tolist()
-        return idxs[0] if idxs else None
 
-    level_idx = find_row("Level")
-    item_idx = find_row("Held Item")
-    ability_idx = find_row("Ability")
-    nature_idx = find_row("Nature")
-    moves_start_idx = find_row("Moves")
+    level_idx = _first_row(label_rows, "Level", start_row, end_row)
+    item_idx = _first_row(label_rows, "Held Item", start_row, end_row)
+    ability_idx = _first_row(label_rows, "Ability", start_row, end_row)
+    nature_idx = _first_row(label_rows, "Nature", start_row, end_row)
+    moves_start_idx = _first_row(label_rows, "Moves", start_row, end_row)
 
     if None in (level_idx, item_idx, ability_idx, nature_idx, moves_start_idx):
         return None
 
-    moves_rows = sub.iloc[moves_start_idx:]
-    team_cols: List[str] = []
-    for col in df.columns[1:]:
-        val = species_row.get(col)
-        if isinstance(val, str) and val.strip():
-            team_cols.append(col)
+    moves_np = arr[moves_start_idx:]
+    species_cells = arr[pok_idx + 1]
+
+    team_cols = [
+        j
+        for j in range(1, len(species_cells))
+        if isinstance(species_cells[j], str) and species_cells[j].strip()
+    ]
 
     team: List[TrainerPokemon] = []
     canon_name = canonical_trainer_name(raw_name)
 
-    for col in team_cols:
-        species_val = species_row[col]
-        if isinstance(species_val, float) and pd.isna(species_val):
+    for j in team_cols:
+        species_val = species_cells[j]
+        if _is_missing(species_val):
             continue
         species = str(species_val).strip()
         if not species:
             continue
+        species = sys.intern(species)
 
-        raw_level = sub.iloc[level_idx][col]
-        if isinstance(raw_level, float) and pd.isna(raw_level):
+        raw_level = arr[level_idx, j]
+        if raw_level == "" or _is_missing(raw_level):
             continue
-        level = int(str(raw_level).strip())
-
-        def clean_opt(row_idx: int) -> Optional[str]:
-            v = sub.iloc[row_idx].get(col)
-            if isinstance(v, float) and pd.isna(v):
-                return None
-            if v is None:
-                return None
-            s = str(v).strip()
-            return s or None
-
-        item = clean_opt(item_idx)
-        ability = clean_opt(ability_idx)
-        nature = clean_opt(nature_idx)
-
-        moves: List[str] = []
-        for _, row in moves_rows.iterrows():
-            mv = row.get(col)
-            if isinstance(mv, float) and pd.isna(mv):
-                continue
-            if mv is None:
-                continue
-            s = str(mv).strip()
-            if s:
-                moves.append(s)
-
-        ivs = {stat: 31 for stat in STAT_NAMES}
         override = iv_overrides.get((canon_name, species))
-        if override:
-            ivs.update(override)
 
         team.append(
             TrainerPokemon(
                 species=species,
-                level=level,
-                item=item,
-                ability=ability,
-                nature=nature,
-                moves=moves,
-                ivs=ivs,
+                level=int(str(raw_level).strip()),
+                item=_clean_opt(arr[item_idx, j]),
+                ability=_clean_opt(arr[ability_idx, j]),
+                nature=_clean_opt(arr[nature_idx, j]),
+                moves=[m for m in map(_clean_opt, moves_np[:, j]) if m],
+                ivs={**_DEFAULT_IVS, **override} if override else _DEFAULT_IVS,
             )
         )
 
@@ -234,10 +247,13 @@ def _parse_trainer_block(
 
     fmt = detect_battle_format(raw_name)
 
+    # Species/items/moves/locations repeat across thousands of team slots;
+    # interning makes the duplicates share one string object.
+    sheet_name = sys.intern(sheet_name)
     if sheet_name == "Pokémon League":
         location = sheet_name
     else:
-        location = str(df.columns[1])
+        location = sys.intern(str(df.columns[1]))
 
     trainer_id = f"{canon_name}@{sheet_name}@{fmt}"
 
@@ -257,14 +273,15 @@ def parse_trainer_sheet(
     sheet_name: str,
     iv_overrides: Dict[Tuple[str, str], Dict[str, int]],
 ) -> List[Trainer]:
-    key_col = df.columns[0]
     trainers: List[Trainer] = []
     n_rows = len(df)
     if n_rows == 0:
         return trainers
 
-    name_rows = df.index[df[key_col] == "Name"].tolist()
-    first_label = df.iloc[0][key_col]
+    sheet_arr = df.to_numpy(dtype=object, copy=False)
+    label_rows = _index_labels(sheet_arr[:, 0])
+    name_rows = label_rows.get("Name", [])
+    first_label = sheet_arr[0, 0]
 
     if isinstance(first_label, str) and first_label == "Pokémon":
         pre_end = name_rows[0] if name_rows else n_rows
@@ -276,11 +293,12 @@ def parse_trainer_sheet(
             pre_end,
             iv_overrides=iv_overrides,
             pre_block_name=pre_name,
+            sheet_arr=sheet_arr,
+            label_rows=label_rows,
         )
         if t is not None:
             trainers.append(t)
 
-    name_rows = df.index[df[key_col] == "Name"].tolist()
     for i, start_row in enumerate(name_rows):
         end_row = name_rows[i + 1] if i + 1 < len(name_rows) else n_rows
         t = _parse_trainer_block(
@@ -289,6 +307,8 @@ def parse_trainer_sheet(
             start_row,
             end_row,
             iv_overrides=iv_overrides,
+            sheet_arr=sheet_arr,
+            label_rows=label_rows,
         )
         if t is not None:
             trainers.append(t)
@@ -296,50 +316,101 @@ def parse_trainer_sheet(
     return trainers
 
 
+def _load_ivs(ivs: Optional[Dict[str, int]]) -> Dict[str, int]:
+    if ivs == _DEFAULT_IVS:
+        return _DEFAULT_IVS
+    return dict(ivs or {})
+
+
+# Per-process copy of the IV overrides, installed once by the pool
+# initializer so each sheet task only pickles its DataFrame.
+_worker_iv_overrides: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+
+def _read_trainer_sheets(workbook_path: str) -> Dict[str, pd.DataFrame]:
+    # Decode every trainer sheet in one parse call on a workbook that is
+    # opened once and closed afterwards; Dex/Sprites are never read.
+    # Every cell is stringified by the parser anyway, so skip dtype
+    # inference and NA detection; empty cells arrive as "".
+    with pd.ExcelFile(workbook_path, engine="openpyxl") as xls:
+        wanted = [s for s in xls.sheet_names if s not in ("Dex", "Sprites")]
+        return xls.parse(wanted, dtype=object, na_filter=False)
+
+
+def _init_sheet_worker(iv_overrides: Dict[Tuple[str, str], Dict[str, int]]) -> None:
+    global _worker_iv_overrides
+    _worker_iv_overrides = iv_overrides
+
+
+def _parse_sheet_in_worker(df: pd.DataFrame, sheet_name: str) -> List[Trainer]:
+    return parse_trainer_sheet(df, sheet_name, _worker_iv_overrides)
+
+
 class TrainerDex:
     def __init__(self, trainers: List[Trainer]):
-        self.trainers_by_id: Dict[str, Trainer] = {t.id: t for t in trainers}
-        self.trainers_by_name: Dict[str, List[Trainer]] = {}
+        by_id: Dict[str, Trainer] = {}
+        by_name: DefaultDict[str, List[Trainer]] = defaultdict(list)
         for t in trainers:
-            self.trainers_by_name.setdefault(t.name, []).append(t)
+            by_id[t.id] = t
+            by_name[t.name].append(t)
+        self.trainers_by_id: Dict[str, Trainer] = by_id
+        # Plain dict so lookups of unknown names don't insert empty lists.
+        self.trainers_by_name: Dict[str, List[Trainer]] = dict(by_name)
 
     @classmethod
     def from_workbook(
         cls,
         workbook_path: str,
         setdex_js_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ) -> "TrainerDex":
         if setdex_js_path is not None:
             iv_overrides = load_iv_overrides_from_setdex_js(setdex_js_path)
         else:
             iv_overrides = {}
 
-        xls = pd.ExcelFile(workbook_path)
+        sheets = list(_read_trainer_sheets(workbook_path).items())
+
         trainers: List[Trainer] = []
-        for sheet in xls.sheet_names:
-            if sheet in ("Dex", "Sprites"):
-                continue
-            df = xls.parse(sheet)
-            trainers.extend(parse_trainer_sheet(df, sheet, iv_overrides))
+        if max_workers is not None and max_workers > 1 and len(sheets) > 1:
+            # Sheets are independent; map keeps workbook order.
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_sheet_worker,
+                initargs=(iv_overrides,),
+            ) as pool:
+                for sheet_trainers in pool.map(
+                    _parse_sheet_in_worker,
+                    [df for _, df in sheets],
+                    [sheet for sheet, _ in sheets],
+                ):
+                    trainers.extend(sheet_trainers)
+        else:
+            for sheet, df in sheets:
+                trainers.extend(parse_trainer_sheet(df, sheet, iv_overrides))
         return cls(trainers)
 
     @classmethod
     def from_json(cls, path: str) -> "TrainerDex":
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         trainers: List[Trainer] = []
         for t_data in data.get("trainers", []):
             team: List[TrainerPokemon] = []
             for p_data in t_data["team"]:
                 team.append(
                     TrainerPokemon(
-                        species=p_data["species"],
+                        species=sys.intern(p_data["species"]),
                         level=int(p_data["level"]),
-                        item=p_data.get("item"),
-                        ability=p_data.get("ability"),
-                        nature=p_data.get("nature"),
-                        moves=list(p_data.get("moves", [])),
-                        ivs=dict(p_data.get("ivs", {})),
+                        item=_intern_opt(p_data.get("item")),
+                        ability=_intern_opt(p_data.get("ability")),
+                        nature=_intern_opt(p_data.get("nature")),
+                        moves=[sys.intern(m) for m in p_data.get("moves", [])],
+                        ivs=_load_ivs(p_data.get("ivs")),
                     )
                 )
             trainers.append(
@@ -347,8 +418,8 @@ class TrainerDex:
                     id=t_data["id"],
                     name=t_data["name"],
                     raw_name=t_data.get("raw_name", t_data["name"]),
-                    location=t_data.get("location"),
-                    group=t_data.get("group", ""),
+                    location=_intern_opt(t_data.get("location")),
+                    group=sys.intern(t_data.get("group", "")),
                     battle_format=t_data.get("battle_format", "single"),
                     team=team,
                 )
@@ -384,6 +455,10 @@ class TrainerDex:
 
     def to_json(self, path: str) -> None:
         data = self.to_dict()
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
@@ -406,8 +481,10 @@ def build_trainer_json(
     dex = TrainerDex.from_workbook(workbook_path, setdex_js_path=setdex_js_path)
     dex.to_json(out_path)
 
-build_trainer_json(
-    "Trainer Battles.xlsx",
-    "gen8.js",
-    "trainer_data.json",
-)
\ No newline at end of file
+
+if __name__ == "__main__":
+    build_trainer_json(
+        "Trainer Battles.xlsx",
+        "gen8.js",
+        "trainer_data.json",
+    )